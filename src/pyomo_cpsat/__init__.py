@@ -1 +1,7 @@
+from .cancellation import CancellationToken
 from .cpsat import Cpsat, IncompatibleModelError
+from .lns import LargeNeighborhoodSearch
+from .mapped_solution import MappedSolution
+from .pareto import ParetoFront
+from .rolling_horizon import RollingHorizon
+from .streaming import StreamingModel, StreamingCpsat
@@ -0,0 +1,89 @@
+import contextlib
+import signal
+import threading
+
+
+class CancellationToken:
+    """
+    Token for cancelling Cpsat solves from another thread or on SIGINT
+
+    The token is passed to Cpsat.solve with the cancellation_token option.
+    Cancelling it stops the search of the CP-SAT solvers of the solves using it,
+    as if a time limit was reached: the best solution found so far is kept,
+    and the termination condition of the results is interrupted. Solves started
+    with a token that is already cancelled stop immediately.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._solvers = set()
+
+        # If True, SIGINT is handled by the token rather than by CP-SAT
+        self.handles_sigint = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        """
+        Stop the running CP-SAT searches of the solves using the token.
+        """
+        with self._lock:
+            self._cancelled = True
+            solvers = list(self._solvers)
+
+        for cpsat_solver in solvers:
+            # CpSolver.stop_search has no effect before the search has started,
+            # so the time limit is also set for a search that is starting
+            cpsat_solver.parameters.max_time_in_seconds = 0
+            cpsat_solver.stop_search()
+
+    @contextlib.contextmanager
+    def cancel_on_sigint(self):
+        """
+        Context manager cancelling the token on SIGINT (Ctrl-C), e.g. while
+        the main thread waits for solves running in other threads. It must be
+        entered in the main thread.
+        """
+        previous_handler = signal.signal(signal.SIGINT, lambda *args: self.cancel())
+        self.handles_sigint = True
+
+        try:
+            yield self
+        finally:
+            self.handles_sigint = False
+            signal.signal(signal.SIGINT, previous_handler)
+
+    @contextlib.contextmanager
+    def _solving(self, cpsat_solver):
+        """
+        Context manager registering a CP-SAT solver while it solves.
+        """
+        with self._lock:
+            self._solvers.add(cpsat_solver)
+            cancelled = self._cancelled
+
+        if cancelled:
+            cpsat_solver.parameters.max_time_in_seconds = 0
+
+        if self.handles_sigint:
+            cpsat_solver.parameters.catch_sigint_signal = False
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._solvers.discard(cpsat_solver)
+
+
+def _cancellable(token, cpsat_solver):
+    """
+    Return a context manager registering a CP-SAT solver with a cancellation
+    token (if not None) while it solves.
+    """
+    if token is None:
+        return contextlib.nullcontext()
+
+    return token._solving(cpsat_solver)
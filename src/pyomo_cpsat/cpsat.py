@@ -1,23 +1,39 @@
-import io
 import datetime
+import fractions
+import heapq
 import logging
+import math
+import os
+import re
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
 
 from typing import Sequence, Optional, Mapping, Tuple, NoReturn
 
 from pyomo.common.timing import HierarchicalTimer
 from pyomo.core.base.constraint import Constraint
 from pyomo.core.base.var import Var, VarData
-from pyomo.core.base.block import BlockData
+from pyomo.core.base.block import Block, BlockData
 from pyomo.core.expr.numvalue import value
 from pyomo.core.kernel.objective import minimize, maximize
 from pyomo.core.staleflag import StaleFlagManager
 
-from pyomo.common.config import document_kwargs_from_configdict, ConfigValue, Bool
-from pyomo.common.dependencies import attempt_import
+from pyomo.common.config import (
+    document_kwargs_from_configdict,
+    ConfigValue,
+    Bool,
+    In,
+    IsInstance,
+    NonNegativeFloat,
+    PositiveFloat,
+    PositiveInt,
+)
+from pyomo.common.dependencies import attempt_import, numpy as np
 from pyomo.common.errors import ApplicationError, PyomoException
-from pyomo.common.tee import TeeStream, capture_output
 
-from pyomo.repn import generate_standard_repn
+from pyomo.repn.linear import LinearRepnVisitor
 
 from pyomo.contrib.solver.common.base import SolverBase, Availability
 from pyomo.contrib.solver.common.config import BranchAndBoundConfig
@@ -34,13 +50,126 @@ from pyomo.contrib.solver.common.util import (
     get_objective,
 )
 
+from .cancellation import CancellationToken, _cancellable
+from .mapped_solution import _write_solution_file
+
 logger = logging.getLogger(__name__)
 
-ortools, ortools_available = attempt_import('ortools')
+# ortools (and its numpy/pandas/protobuf dependencies) is only imported the
+# first time cp_model or ortools_init is used, e.g. when a Cpsat instance
+# checks its availability or solves a model
+cp_model, ortools_available = attempt_import('ortools.sat.python.cp_model')
+ortools_init, _ = attempt_import('ortools.init.python.init')
+
+# Number of CP-SAT workers for auto_threads by model size (variables plus
+# constraint terms): small models are solved fastest by a single worker, while
+# larger models benefit from the full portfolio of subsolvers
+_AUTO_NUM_WORKERS = [(1_000, 1), (100_000, 8), (math.inf, 16)]
+
+# CP-SAT parameters that are set by Pyomo options
+_PYOMO_EQUIVALENT_KEYS = {
+    'num_workers': 'threads',
+    'max_time_in_seconds': 'time_limit',
+    'relative_gap_limit': 'rel_gap',
+    'absolute_gap_limit': 'abs_gap',
+    'max_deterministic_time': 'deterministic_time_limit',
+    'interleave_search': 'interleave_search',
+    'num_full_subsolvers': 'full_subsolvers',
+}
+
+# scale_objective detects objective coefficients that are fractions with
+# denominators up to _MAX_OBJECTIVE_DENOMINATOR, and multiplies the objective by
+# a factor of at most _MAX_OBJECTIVE_SCALE to make them integral
+_MAX_OBJECTIVE_DENOMINATOR = 10**6
+_MAX_OBJECTIVE_SCALE = 10**9
+
+# Repeated CP-SAT parameters, which are extended rather than set
+_REPEATING_KEYS = frozenset(
+    ['RestartAlgorithm', 'subsolvers', 'extra_subsolvers', 'ignore_subsolvers']
+)
+
+
+def _copy_proto(target, source):
+    """
+    Copy a CP-SAT proto message into a message of the same type. In OR-Tools
+    9.15 and later, the protos of the CP-SAT Python API are no longer protobuf
+    messages, and the protobuf methods are replaced by snake case methods.
+    """
+    if hasattr(target, 'CopyFrom'):
+        target.CopyFrom(source)
+    else:
+        target.copy_from(source)
+
+
+def _has_field(message, field):
+    """
+    Return whether a message field of a CP-SAT proto message is set.
+    """
+    if hasattr(message, 'HasField'):
+        return message.HasField(field)
+
+    return getattr(message, f'has_{field}')()
+
+
+def _clear_field(message, field):
+    """
+    Clear a message field of a CP-SAT proto message.
+    """
+    if hasattr(message, 'ClearField'):
+        message.ClearField(field)
+    else:
+        getattr(message, f'clear_{field}')()
+
+
+def _set_repeated(field, values):
+    """
+    Replace the values of a repeated field of a CP-SAT proto message. The
+    repeated fields of OR-Tools 9.15 and later support neither slice assignment
+    nor deletion, and those of older protobuf versions have no clear method.
+    """
+    if hasattr(field, 'clear'):
+        field.clear()
+    else:
+        del field[:]
+
+    field.extend(values)
+
+
+# Field of the variable references of each kind of CP-SAT constraint proto
+# built by the interface
+_CONSTRAINT_REF_FIELDS = {
+    'linear': 'vars',
+    'bool_and': 'literals',
+    'circuit': 'literals',
+    'routes': 'literals',
+}
+
+
+def _constraint_kind(con):
+    """
+    Return the kind of a CP-SAT constraint proto. Without protobuf messages,
+    only the kinds of constraints built by the interface are recognized.
+    """
+    if hasattr(con, 'WhichOneof'):
+        return con.WhichOneof('constraint')
+
+    return next(
+        (kind for kind in _CONSTRAINT_REF_FIELDS if getattr(con, f'has_{kind}')()),
+        None,
+    )
+
+
+def _proto_constraint_vars(con):
+    """
+    Return the variable references of a CP-SAT constraint proto.
+    """
+    refs = list(con.enforcement_literal)
+
+    kind = _constraint_kind(con)
+    if kind in _CONSTRAINT_REF_FIELDS:
+        refs += getattr(getattr(con, kind), _CONSTRAINT_REF_FIELDS[kind])
 
-if ortools_available:
-    from ortools.sat.python import cp_model
-    from ortools.init.python.init import OrToolsVersion
+    return refs
 
 
 class IncompatibleModelError(PyomoException):
@@ -85,6 +214,374 @@ class CpsatConfig(BranchAndBoundConfig):
             ),
         )
 
+        self.deterministic_time_limit: Optional[float] = self.declare(
+            'deterministic_time_limit',
+            ConfigValue(
+                domain=NonNegativeFloat,
+                default=None,
+                description='Limit on the deterministic time of CP-SAT '
+                '(max_deterministic_time). Unlike time_limit, the deterministic time '
+                'does not depend on the machine or its load, so solves stopped by '
+                'this limit are reproducible.',
+            ),
+        )
+
+        self.interleave_search: Optional[bool] = self.declare(
+            'interleave_search',
+            ConfigValue(
+                domain=Bool,
+                default=None,
+                description='If True, CP-SAT runs its subsolvers interleaved in '
+                'deterministic batches instead of concurrently; combined with '
+                'threads, this makes multi-threaded solves reproducible.',
+            ),
+        )
+
+        self.full_subsolvers: Optional[int] = self.declare(
+            'full_subsolvers',
+            ConfigValue(
+                domain=PositiveInt,
+                default=None,
+                description='Number of the CP-SAT workers that run a full search '
+                '(num_full_subsolvers); the remaining workers run first-solution and '
+                'large neighborhood search subsolvers. Cannot exceed threads.',
+            ),
+        )
+
+        self.auto_threads: bool = self.declare(
+            'auto_threads',
+            ConfigValue(
+                domain=Bool,
+                default=False,
+                description='If True, the number of CP-SAT workers is chosen from the '
+                'size of the translated model (at most the number of CPUs) and '
+                'reported in extra_info.num_workers. Cannot be combined with threads.',
+            ),
+        )
+
+        self.strict_integer: bool = self.declare(
+            'strict_integer',
+            ConfigValue(
+                domain=Bool,
+                default=False,
+                description='If True, validates and converts all variable bounds, '
+                'constraint coefficients and constraint bounds to integers in bulk '
+                'before passing them to CP-SAT, raises an IncompatibleModelError for '
+                'fractional coefficients or possible 64-bit integer overflow, and '
+                'replaces missing constraint bounds with the bounds implied by the '
+                'variable bounds.',
+            ),
+        )
+
+        self.reduce_rows: bool = self.declare(
+            'reduce_rows',
+            ConfigValue(
+                domain=Bool,
+                default=False,
+                description='If True, reduces the linear constraints before passing '
+                'them to CP-SAT: constant constraints that are satisfied are dropped, '
+                'constraints with a single variable are turned into tightened '
+                'variable domains, and constraints with the same linear part are '
+                'merged. Ignored when find_infeasible_subsystem is True.',
+            ),
+        )
+
+        self.presolve_only: bool = self.declare(
+            'presolve_only',
+            ConfigValue(
+                domain=Bool,
+                default=False,
+                description='If True, runs only the presolve of CP-SAT '
+                '(stop_after_presolve) and reports the size of the translated and '
+                'presolved models in extra_info.presolve_stats. No solution is '
+                'found, and the values of the keyword arguments '
+                'raise_exception_on_nonoptimal_result and load_solutions are ignored.',
+            ),
+        )
+
+        self.presolve_tightened_model: bool = self.declare(
+            'presolve_tightened_model',
+            ConfigValue(
+                domain=Bool,
+                default=False,
+                description='If True and presolve_only is True, '
+                'extra_info.presolve_tightened_model holds the translated CP-SAT '
+                'model proto with its variable domains tightened by presolve.',
+            ),
+        )
+
+        self.decomposition: Optional[str] = self.declare(
+            'decomposition',
+            ConfigValue(
+                domain=In(['components', 'blocks']),
+                default=None,
+                description='If set, splits the model into independent parts and '
+                'solves them as separate CP-SAT models in parallel. With '
+                "'components', the parts are the connected components of the "
+                "variable/constraint incidence graph. With 'blocks', the variables "
+                'of each top-level block are also kept in the same part. The '
+                'objective must be separable, which holds for linear objectives. '
+                'Cannot be combined with find_infeasible_subsystem or '
+                'lexicographic_objectives.',
+            ),
+        )
+
+        self.decomposition_workers: Optional[int] = self.declare(
+            'decomposition_workers',
+            ConfigValue(
+                domain=PositiveInt,
+                default=None,
+                description='Maximum number of CP-SAT models solved in parallel when '
+                'decomposition is set; smaller parts are packed together. Defaults '
+                'to the number of CPUs. The threads (num_workers) of CP-SAT are '
+                'shared between the models solved in parallel.',
+            ),
+        )
+
+        self.symmetric_index_sets: Optional[list] = self.declare(
+            'symmetric_index_sets',
+            ConfigValue(
+                domain=list,
+                default=None,
+                description='List of interchangeable index sets (e.g. identical '
+                'machines or vehicles), each given as a tuple (index_set, vars), '
+                'where vars is a list of the Var components indexed by index_set, '
+                'each given as a Var or as a tuple (Var, position) with the position '
+                'of index_set in its index (defaults to -1, the last position). '
+                'Permuting the elements of index_set must map solutions to '
+                'solutions with the same objective value. Lexicographic '
+                'symmetry-breaking constraints are added, ordering the values of '
+                'the variables of consecutive elements of index_set.',
+            ),
+        )
+
+        self.circuits: Optional[list] = self.declare(
+            'circuits',
+            ConfigValue(
+                domain=list,
+                default=None,
+                description='List of binary Var components indexed by arcs (i, j) '
+                'between nodes, e.g. of routing models, each given as a tuple '
+                '(arc_var, depot, constraints). If depot is None, a CP-SAT circuit '
+                'constraint is added: the arcs with value 1 form a single circuit '
+                'visiting every node, except the nodes i of (i, i) arcs with value '
+                '1. Otherwise, a CP-SAT multiple circuit constraint is added: the '
+                'arcs with value 1 form circuits through the depot node, visiting '
+                'every other node once. constraints is an optional list of the '
+                'Constraint components that the circuit constraint replaces (e.g. '
+                'subtour elimination and flow conservation rows), which are not '
+                'passed to CP-SAT.',
+            ),
+        )
+
+        self.scale_objective: bool = self.declare(
+            'scale_objective',
+            ConfigValue(
+                domain=Bool,
+                default=False,
+                description='If True, an objective with fractional coefficients is '
+                'multiplied by the least common multiple of the denominators of its '
+                'coefficients, and passed to CP-SAT as an integer objective rather '
+                'than a floating point objective that CP-SAT scales approximately. '
+                'The scale factor is reported in extra_info.objective_scale, and the '
+                'objective value and bound are reported in the units of the model.',
+            ),
+        )
+
+        self.objective_precision: Optional[float] = self.declare(
+            'objective_precision',
+            ConfigValue(
+                domain=PositiveFloat,
+                default=None,
+                description='With scale_objective, the objective coefficients are '
+                'rounded to multiples of objective_precision (e.g. 0.001) instead of '
+                'being scaled exactly. The reported objective value is the exact '
+                'value of the solution.',
+            ),
+        )
+
+        self.lexicographic_objectives: Optional[list] = self.declare(
+            'lexicographic_objectives',
+            ConfigValue(
+                domain=list,
+                default=None,
+                description='Ordered list of Pyomo objectives to optimize '
+                'lexicographically. Each objective is optimized in turn on the same '
+                'CP-SAT model; after each stage, the objective is constrained to its '
+                'stage value (within lexicographic_tolerance) and the stage solution is '
+                'passed to CP-SAT as a hint for the next stage. When set, the active '
+                'objectives of the model are ignored.',
+            ),
+        )
+
+        self.lexicographic_tolerance: float = self.declare(
+            'lexicographic_tolerance',
+            ConfigValue(
+                domain=NonNegativeFloat,
+                default=0.0,
+                description='Absolute amount by which the value of each '
+                'lexicographic objective may degrade in later stages.',
+            ),
+        )
+
+        self.progress_timeline: bool = self.declare(
+            'progress_timeline',
+            ConfigValue(
+                domain=Bool,
+                default=False,
+                description='If True, records the wall time (in seconds since the '
+                'start of the solve), incumbent objective value and best objective '
+                'bound each time CP-SAT finds a solution or improves the bound, and '
+                'stores them as arrays in extra_info.progress_timeline. The '
+                'parts of a decomposed model are not recorded.',
+            ),
+        )
+
+        self.solution_file: Optional[str] = self.declare(
+            'solution_file',
+            ConfigValue(
+                domain=str,
+                default=None,
+                description='Path of a file to which the CP-SAT status, objective '
+                'value, best objective bound and solution are written as a '
+                'memory-mapped array, e.g. by a worker process. The solution can be '
+                'loaded into the Pyomo model with MappedSolution, without copying.',
+            ),
+        )
+
+        self.cancellation_token: Optional[CancellationToken] = self.declare(
+            'cancellation_token',
+            ConfigValue(
+                domain=IsInstance(CancellationToken),
+                default=None,
+                description='CancellationToken for stopping the solve from another '
+                'thread or on SIGINT. The best solution found before the '
+                'cancellation is kept, with termination condition interrupted.',
+            ),
+        )
+
+
+class _ProgressTimeline:
+    """
+    Timeline of the incumbent objective value and the best objective bound of
+    CP-SAT solves, recorded from the CP-SAT callbacks
+    """
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+        self.incumbent = math.nan
+        self.bound = math.nan
+
+        self.wall_times = []
+        self.incumbents = []
+        self.bounds = []
+
+    def record(self, incumbent=None, bound=None):
+        with self._lock:
+            if incumbent is not None:
+                self.incumbent = incumbent
+            if bound is not None:
+                self.bound = bound
+
+            self.wall_times.append(time.perf_counter() - self._start)
+            self.incumbents.append(self.incumbent)
+            self.bounds.append(self.bound)
+
+    def record_bound(self, bound):
+        self.record(bound=bound)
+
+    def solution_callback(self):
+        """
+        Return a CP-SAT solution callback recording the objective value of each
+        solution.
+        """
+        timeline = self
+
+        class SolutionCallback(cp_model.CpSolverSolutionCallback):
+            def on_solution_callback(self):
+                timeline.record(incumbent=self.objective_value)
+
+        return SolutionCallback()
+
+    def arrays(self):
+        return {
+            'wall_time': np.array(self.wall_times, dtype=np.float64),
+            'incumbent': np.array(self.incumbents, dtype=np.float64),
+            'bound': np.array(self.bounds, dtype=np.float64),
+        }
+
+
+class _SolveContext:
+    """
+    State of a single call to Cpsat.solve
+    """
+
+    def __init__(self):
+        self.config = None
+        self.model = None
+
+        self.solver_model = None
+        self.solver_response = None
+        self.solver_status = None
+
+        self.vars = []
+        self.var_bounds = []
+        self.pyomo_var_to_solver_index = {}
+
+        self.repn_visitor = None
+        self.objective = None
+
+        self.deterministic_time = 0.0
+        self.progress_timeline = None
+        self.objective_scaling = None
+
+
+class _ThreadState(threading.local):
+    """
+    State of the solves of a Cpsat instance in one thread: the context of the
+    current (or last) solve, and the CP-SAT solver and compiled parameters
+    reused across solves
+    """
+
+    def __init__(self):
+        self.context = _SolveContext()
+
+        self.solver_solver = None
+        self.parameters_key = None
+        self.parameters = None
+
+    def __reduce__(self):
+        # A copied (or pickled) Cpsat instance starts without solve state
+        return (_ThreadState, ())
+
+
+class _SolveAttribute:
+    """
+    Attribute of a Cpsat instance stored in the context of the solve running in
+    the current thread, or, if per_thread, in the state of the current thread
+    """
+
+    def __init__(self, per_thread=False):
+        self.per_thread = per_thread
+
+    def __set_name__(self, owner, name):
+        self.name = name.lstrip('_')
+
+    def _state(self, instance):
+        if self.per_thread:
+            return instance._thread_state
+        return instance._thread_state.context
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(self._state(instance), self.name)
+
+    def __set__(self, instance, value):
+        setattr(self._state(instance), self.name, value)
+
 
 class CpsatSolutionLoader(SolutionLoaderBase):
     """
@@ -93,22 +590,26 @@ class CpsatSolutionLoader(SolutionLoaderBase):
 
     def __init__(
         self,
-        cpsat_solver: cp_model.CpSolver,
+        cpsat_solution: Sequence[int],
         pyomo_vars: Sequence[VarData],
-        pyomo_cpsat_map=Mapping[int, cp_model.IntVar],
+        pyomo_cpsat_map: Mapping[int, int],
     ):
-        self.cpsat_solver = cpsat_solver
+        # The solution of a CP-SAT response is a view that does not keep the
+        # response alive, so the values are copied
+        self.cpsat_solution = list(cpsat_solution)
         self.pyomo_vars = pyomo_vars
         self.pyomo_cpsat_map = pyomo_cpsat_map
 
     def load_vars(self, vars_to_load: Optional[Sequence[VarData]] = None) -> NoReturn:
         if vars_to_load is None:
-            vars_to_load = self.pyomo_vars
-
-        for v in vars_to_load:
-            cpsat_var = self.pyomo_cpsat_map[id(v)]
-            cpsat_val = self.cpsat_solver.value(cpsat_var)
-            v.set_value(cpsat_val, skip_validation=True)
+            # The CP-SAT variables are created in the order of pyomo_vars, so
+            # the solution is loaded in bulk
+            for v, cpsat_val in zip(self.pyomo_vars, self.cpsat_solution):
+                v.set_value(cpsat_val, skip_validation=True)
+        else:
+            for v in vars_to_load:
+                cpsat_val = self.cpsat_solution[self.pyomo_cpsat_map[id(v)]]
+                v.set_value(cpsat_val, skip_validation=True)
 
         StaleFlagManager.mark_all_as_stale(delayed=True)
 
@@ -123,18 +624,38 @@ class Cpsat(SolverBase):
 
     CONFIG = CpsatConfig()
 
-    def __init__(self, **kwds) -> None:
-        super().__init__(**kwds)
+    # The state of a solve is kept in a context per call, in thread-local
+    # storage, so that a Cpsat instance can be shared by threads solving
+    # concurrently; after a solve, these attributes refer to the last solve of
+    # the current thread
+    _config = _SolveAttribute()
+    _model = _SolveAttribute()
+
+    _solver_model = _SolveAttribute()
+    _solver_response = _SolveAttribute()
+    _solver_status = _SolveAttribute()
 
-        self._config = None
+    _vars = _SolveAttribute()
+    _var_bounds = _SolveAttribute()
+    _pyomo_var_to_solver_index = _SolveAttribute()
 
-        self._solver_model = None
-        self._solver_solver = None
+    _repn_visitor = _SolveAttribute()
+    _objective = _SolveAttribute()
 
-        self._model = None
+    _deterministic_time = _SolveAttribute()
+    _progress_timeline = _SolveAttribute()
+    _objective_scaling = _SolveAttribute()
+
+    # The CP-SAT solver and the compiled parameters are reused across the
+    # solves of a thread
+    _solver_solver = _SolveAttribute(per_thread=True)
+    _parameters_key = _SolveAttribute(per_thread=True)
+    _parameters = _SolveAttribute(per_thread=True)
+
+    def __init__(self, **kwds) -> None:
+        super().__init__(**kwds)
 
-        self._vars = []
-        self._pyomo_var_to_solver_var_map = {}
+        self._thread_state = _ThreadState()
 
     def available(self) -> Availability:
         if ortools_available:
@@ -144,9 +665,9 @@ class Cpsat(SolverBase):
 
     def version(self) -> Tuple:
         return (
-            OrToolsVersion.major_number(),
-            OrToolsVersion.minor_number(),
-            OrToolsVersion.patch_number(),
+            ortools_init.OrToolsVersion.major_number(),
+            ortools_init.OrToolsVersion.minor_number(),
+            ortools_init.OrToolsVersion.patch_number(),
         )
 
     @document_kwargs_from_configdict(CONFIG)
@@ -183,8 +704,43 @@ class Cpsat(SolverBase):
 
         start_timestamp = datetime.datetime.now(datetime.timezone.utc)
 
+        # A new context for the state of this solve, in the current thread
+        self._thread_state.context = _SolveContext()
+
         self._config = self.config(value=kwargs, preserve_implicit=True)
 
+        if self._config.decomposition is not None and (
+            self._config.find_infeasible_subsystem
+            or self._config.lexicographic_objectives is not None
+        ):
+            raise ValueError(
+                'decomposition cannot be combined with find_infeasible_subsystem '
+                'or lexicographic_objectives.'
+            )
+
+        if self._config.presolve_only and (
+            self._config.find_infeasible_subsystem
+            or self._config.lexicographic_objectives is not None
+            or self._config.decomposition is not None
+        ):
+            raise ValueError(
+                'presolve_only cannot be combined with find_infeasible_subsystem, '
+                'lexicographic_objectives or decomposition.'
+            )
+
+        if self._config.auto_threads and (
+            self._config.threads is not None
+            or 'num_workers' in self._config.solver_options
+        ):
+            raise ValueError('auto_threads cannot be combined with threads.')
+
+        if (
+            self._config.full_subsolvers is not None
+            and self._config.threads is not None
+            and self._config.full_subsolvers > self._config.threads
+        ):
+            raise ValueError('full_subsolvers cannot exceed threads.')
+
         if self._config.timer is None:
             self._config.timer = HierarchicalTimer()
 
@@ -194,82 +750,64 @@ class Cpsat(SolverBase):
 
         self._model = model
 
-        self._solver_model = cp_model.CpModel()
-        self._solver_solver = cp_model.CpSolver()
-
-        # CP-SAT options: google/or-tools/ortools/sat/sat_parameters.proto
-        if self._config.tee:
-            self._solver_solver.parameters.log_search_progress = True
-
-        if self._config.threads is not None:
-            self._solver_solver.parameters.num_workers = self._config.threads
-
-        if self._config.time_limit is not None:
-            self._solver_solver.parameters.max_time_in_seconds = self._config.time_limit
+        if self._config.progress_timeline:
+            self._progress_timeline = _ProgressTimeline()
 
-        if self._config.rel_gap is not None:
-            self._solver_solver.parameters.relative_gap_limit = self._config.rel_gap
+        # Named Expression components are walked once per translation: their
+        # linear representations are cached and reused across constraints and
+        # objectives that refer to them
+        self._repn_visitor = LinearRepnVisitor(subexpression_cache={})
 
-        if self._config.abs_gap is not None:
-            self._solver_solver.parameters.absolute_gap_limit = self._config.abs_gap
+        # The CP-SAT solver is reused across solves, with its parameters reset
+        # from the parameters compiled for the options of this solve
+        if self._solver_solver is None:
+            self._solver_solver = cp_model.CpSolver()
 
-        for key, opt in self._config.solver_options.items():
-            pyomo_equivalent_keys = {
-                'num_workers': 'threads',
-                'max_time_in_seconds': 'time_limit',
-                'relative_gap_limit': 'rel_gap',
-                'absolute_gap_limit': 'abs_gap',
-            }
+        timer.start('set_parameters')
+        _copy_proto(self._solver_solver.parameters, self._solver_parameters())
+        timer.stop('set_parameters')
 
-            eq_key = pyomo_equivalent_keys.get(key, None)
-
-            if eq_key is not None:
-                if getattr(self._config, eq_key) is not None:
-                    raise KeyError(
-                        f'CP-SAT solver option {key} can be specified as Pyomo option {eq_key}.'
-                    )
+        self._translate_model()
 
-            repeating_keys = [
-                'RestartAlgorithm',
-                'subsolvers',
-                'extra_subsolvers',
-                'ignore_subsolvers',
-            ]
+        if self._config.auto_threads:
+            self._solver_solver.parameters.num_workers = self._auto_num_workers()
 
-            if key in repeating_keys:
-                try:
-                    getattr(self._solver_solver.parameters, key).extend(opt)
-                except TypeError:
-                    raise
+        if self._config.presolve_only:
+            extra_info = self._presolve_model()
+        else:
+            extra_info = self._optimize_model()
 
-            else:
-                try:
-                    setattr(self._solver_solver.parameters, key, opt)
-                except TypeError:
-                    raise
+        # Total over all CP-SAT solves of this call
+        extra_info['deterministic_time'] = self._deterministic_time
 
-        timer.start('add_variables')
-        self._add_variables()
-        timer.stop('add_variables')
+        if self._progress_timeline is not None:
+            extra_info['progress_timeline'] = self._progress_timeline.arrays()
 
-        timer.start('add_constraints')
-        self._add_constraints()
-        timer.stop('add_constraints')
+        if self._config.auto_threads:
+            extra_info['num_workers'] = self._solver_solver.parameters.num_workers
 
-        timer.start('set_objective')
-        self._set_objective()
-        timer.stop('set_objective')
+        if self._objective_scaling is not None:
+            extra_info['objective_scale'] = self._objective_scaling[0]
 
-        ostreams = [io.StringIO()] + self._config.tee
-        with capture_output(output=TeeStream(*ostreams), capture_fd=True):
-            timer.start('optimize')
-            self._solver_status = self._solver_solver.solve(self._solver_model)
-            timer.stop('optimize')
+        if self._config.solution_file is not None:
+            timer.start('write_solution_file')
+            _write_solution_file(
+                self._config.solution_file,
+                len(self._solver_model.proto.variables),
+                self._solver_status,
+                self._solver_response.objective_value,
+                self._solver_response.best_objective_bound,
+                self._solver_response.solution,
+            )
+            timer.stop('write_solution_file')
 
         timer.start('load_results')
         results = self._load_results()
         timer.stop('load_results')
 
+        for key, val in extra_info.items():
+            setattr(results.extra_info, key, val)
+
         if self._config.find_infeasible_subsystem:
             self._output_infeasible_subsystem()
 
@@ -282,6 +820,112 @@ class Cpsat(SolverBase):
 
         return results
 
+    def _solver_parameters(self):
+        """
+        Return the CP-SAT parameters for the options of this solve. The
+        parameters are compiled once and reused while the options are unchanged.
+        """
+        config = self._config
+
+        parameters_key = (
+            bool(config.tee),
+            config.threads,
+            config.time_limit,
+            config.rel_gap,
+            config.abs_gap,
+            config.deterministic_time_limit,
+            config.interleave_search,
+            config.full_subsolvers,
+            [
+                (key, tuple(opt) if isinstance(opt, list) else opt)
+                for key, opt in config.solver_options.items()
+            ],
+        )
+
+        if parameters_key == self._parameters_key:
+            return self._parameters
+
+        # CP-SAT options: google/or-tools/ortools/sat/sat_parameters.proto
+        # The parameters have the type of CpSolver.parameters, which is not a
+        # protobuf message in OR-Tools 9.15 and later
+        parameters = type(self._solver_solver.parameters)()
+
+        # The log of CP-SAT is passed to the tee streams by a log callback
+        # rather than written to the standard output, which is shared by all
+        # the threads of the process
+        parameters.log_to_stdout = False
+
+        if config.tee:
+            parameters.log_search_progress = True
+
+        if config.threads is not None:
+            parameters.num_workers = config.threads
+
+        if config.time_limit is not None:
+            parameters.max_time_in_seconds = config.time_limit
+
+        if config.rel_gap is not None:
+            parameters.relative_gap_limit = config.rel_gap
+
+        if config.abs_gap is not None:
+            parameters.absolute_gap_limit = config.abs_gap
+
+        if config.deterministic_time_limit is not None:
+            parameters.max_deterministic_time = config.deterministic_time_limit
+
+        if config.interleave_search is not None:
+            parameters.interleave_search = config.interleave_search
+
+        if config.full_subsolvers is not None:
+            parameters.num_full_subsolvers = config.full_subsolvers
+
+        for key, opt in config.solver_options.items():
+            eq_key = _PYOMO_EQUIVALENT_KEYS.get(key, None)
+
+            if eq_key is not None:
+                if getattr(config, eq_key) is not None:
+                    raise KeyError(
+                        f'CP-SAT solver option {key} can be specified as Pyomo option {eq_key}.'
+                    )
+
+            if key in _REPEATING_KEYS:
+                getattr(parameters, key).extend(opt)
+            else:
+                setattr(parameters, key, opt)
+
+        self._parameters_key = parameters_key
+        self._parameters = parameters
+
+        return parameters
+
+    def _translate_model(self):
+        """
+        Translate the Pyomo model to a new CP-SAT model.
+        """
+        timer = self._config.timer
+
+        self._solver_model = cp_model.CpModel()
+
+        timer.start('add_variables')
+        self._add_variables()
+        timer.stop('add_variables')
+
+        timer.start('add_constraints')
+        self._add_constraints()
+        timer.stop('add_constraints')
+
+        if self._config.circuits is not None:
+            timer.start('add_circuits')
+            for arc_var, depot, _ in self._circuits():
+                self._add_circuit(arc_var, depot)
+            timer.stop('add_circuits')
+
+        if self._config.symmetric_index_sets is not None:
+            timer.start('add_symmetry_breaking')
+            for index_set, vars in self._config.symmetric_index_sets:
+                self._add_symmetry_breaking(index_set, vars)
+            timer.stop('add_symmetry_breaking')
+
     def _cpsat_bounds_from_var(self, var):
         if var.is_fixed():
             val = var.value
@@ -305,136 +949,1240 @@ class Cpsat(SolverBase):
 
         return lb, ub
 
-    def _add_variables(self):
-        vars = self._model.component_data_objects(Var, descend_into=True)
+    def _cpsat_values_from_var(self, var, lb, ub):
+        """
+        Return the sorted values of a variable whose domain is a finite set with
+        holes (e.g. {0, 50, 100, 200}), or None if the domain of the variable
+        is an integer interval.
+        """
+        if var.is_fixed():
+            return None
 
-        for v in vars:
-            v_id = id(v)
+        domain = var.domain
+
+        if not domain.isfinite() or domain.get_interval()[2] == 1:
+            return None
+
+        values = sorted(val for val in domain if lb <= val <= ub)
+
+        if len(values) == 0:
+            raise IncompatibleModelError(
+                f'Variable ({var.name}) has no values in its domain within its bounds.'
+            )
+
+        if not all(float(val).is_integer() for val in values):
+            raise IncompatibleModelError(
+                f'Variable ({var.name}) has a domain with fractional values. '
+                'CP-SAT cannot solve models with continuous variables.'
+            )
+
+        return [int(val) for val in values]
+
+    def _add_variables(self):
+        vars = self._model.component_data_objects(Var, descend_into=True)
+
+        bounds = []
+        values = []
 
-            if v.is_continuous():
+        for v in vars:
+            # A finite Set domain with a single value has an interval step of
+            # 0 and is reported as continuous; its values are checked below
+            if v.is_continuous() and not v.domain.isfinite():
                 raise IncompatibleModelError(
                     'CP-SAT cannot solve models with continuous variables.'
                 )
 
             lb, ub = self._cpsat_bounds_from_var(v)
+            v_values = self._cpsat_values_from_var(v, lb, ub)
 
-            cpsat_var = self._solver_model.new_int_var(lb, ub, v.name)
+            if v_values is not None:
+                # Bounds of variables with holes in their domains are only
+                # used to bound row activities
+                lb, ub = v_values[0], v_values[-1]
 
-            self._pyomo_var_to_solver_var_map[v_id] = cpsat_var
+            bounds.append((lb, ub))
+            values.append(v_values)
             self._vars.append(v)
 
+        if self._config.strict_integer:
+            bounds = self._strict_integer_var_bounds(bounds)
+
+        # The CP-SAT variables are written to the model proto directly, in the
+        # order of the Pyomo variables, so only the proto index of each variable
+        # is kept
+        proto_vars = self._solver_model.proto.variables
+        var_index = self._pyomo_var_to_solver_index
+
+        for i, (v, (lb, ub), v_values) in enumerate(zip(self._vars, bounds, values)):
+            cpsat_var = proto_vars.add()
+            cpsat_var.name = v.name
+
+            if v_values is None:
+                cpsat_var.domain.extend((lb, ub))
+            else:
+                cpsat_var.domain.extend(
+                    cp_model.Domain.from_values(v_values).flattened_intervals()
+                )
+
+            var_index[id(v)] = i
+
+        self._var_bounds = bounds
+
+    def _strict_integer_var_bounds(self, bounds):
+        """
+        Validate and round the variable bounds to integers. Integral bounds are
+        converted exactly, since doubles only hold integers exactly up to 2**53.
+        CP-SAT requires variable domains within half of the 64-bit integer range.
+        """
+        int_bounds = [(math.ceil(lb), math.floor(ub)) for lb, ub in bounds]
+        max_bound = cp_model.INT_MAX // 2
+
+        for v, (lb, ub) in zip(self._vars, int_bounds):
+            if lb < -max_bound or ub > max_bound:
+                raise IncompatibleModelError(
+                    f'Variable ({v.name}) has a bound outside the integer range '
+                    'supported by CP-SAT.'
+                )
+
+        return int_bounds
+
     def _add_constraints(self):
+        rows = self._linear_rows()
+
+        if self._config.reduce_rows and not self._config.find_infeasible_subsystem:
+            rows = self._reduce_rows(rows)
+
+        if self._config.strict_integer:
+            rows = self._strict_integer_rows(rows)
+
+        proto = self._solver_model.proto
+        var_index = self._pyomo_var_to_solver_index
+
         enforcement_literals = []
 
+        for c, v_ids, coefs, constant, lb, ub in rows:
+            cpsat_con = proto.constraints.add()
+            cpsat_con.name = c.name
+
+            linear = cpsat_con.linear
+            linear.vars.extend([var_index[v_id] for v_id in v_ids])
+
+            # Pyomo gives integral coefficients as floats in some expressions,
+            # which the proto only accepts once converted to integers
+            if all(isinstance(coef, int) for coef in coefs):
+                linear.coeffs.extend(coefs)
+            else:
+                linear.coeffs.extend(self._integer_coefs(c, coefs))
+
+            # The constant is moved into the bounds
+            if lb is not None:
+                cpsat_lb = max(lb - constant, cp_model.INT_MIN)
+            else:
+                cpsat_lb = cp_model.INT_MIN
+
+            if ub is not None:
+                cpsat_ub = min(ub - constant, cp_model.INT_MAX)
+            else:
+                cpsat_ub = cp_model.INT_MAX
+
+            linear.domain.extend((cpsat_lb, cpsat_ub))
+
+            if self._config.find_infeasible_subsystem:
+                literal = len(proto.variables)
+                cpsat_var = proto.variables.add()
+                cpsat_var.name = c.name
+                cpsat_var.domain.extend((0, 1))
+
+                cpsat_con.enforcement_literal.append(literal)
+                enforcement_literals.append(literal)
+
+        if self._config.find_infeasible_subsystem:
+            proto.assumptions.extend(enforcement_literals)
+
+    def _integer_coefs(self, c, coefs):
+        """
+        Return the coefficients of a row as integers.
+        """
+        if not all(float(coef).is_integer() for coef in coefs):
+            raise IncompatibleModelError(
+                f'Constraint {c.name} contains a fractional coefficient. '
+                'CP-SAT cannot solve models with fractional coefficients.'
+            )
+
+        return [int(coef) for coef in coefs]
+
+    def _linear_rows(self):
+        """
+        Compile the active constraints of the model into linear rows, given as
+        tuples (constraint, variable ids, coefficients, constant, lb, ub).
+        """
+        rows = []
+
+        # Rows replaced by circuit constraints are not translated
+        replaced_cons = set()
+        for _, _, replaced in self._circuits():
+            for con in replaced:
+                replaced_cons.update(
+                    id(c) for c in (con.values() if con.is_indexed() else [con])
+                )
+
         cons = self._model.component_data_objects(Constraint, descend_into=True)
 
         for c in cons:
-            if not c.active:
+            if not c.active or id(c) in replaced_cons:
                 continue
 
-            # If we set quadratic=False in generate_standard_repn(),
-            # we only need to check for nonlinear expressions
-            repn = generate_standard_repn(c.body, quadratic=False)
+            repn = self._repn_visitor.walk_expression(c.body)
 
-            if repn.nonlinear_expr is not None:
+            if repn.nonlinear is not None:
                 raise IncompatibleModelError(
                     f'Constraint {c.name} contains a nonlinear expression. '
                     'CP-SAT cannot solve models with nonlinear constraints.'
                 )
 
-            if len(repn.linear_vars) > 0:
-                cpsat_expr = cp_model.LinearExpr.weighted_sum(
-                    [
-                        self._pyomo_var_to_solver_var_map[id(v)]
-                        for v in repn.linear_vars
-                    ],
-                    repn.linear_coefs,
-                )
-            else:
-                cpsat_expr = 0
-
-            if not repn.constant.is_integer():
+            if not float(repn.constant).is_integer():
                 raise IncompatibleModelError(
                     f'Constraint {c.name} contains a fractional constant. '
                     'CP-SAT cannot solve models with fractional coefficients.'
                 )
-            else:
-                # Pyomo sometimes generates a StandardRepn
-                # with an integer constant as a float
-                cpsat_expr += int(repn.constant)
 
-            if c.has_lb():
-                cpsat_lb = c.lb
+            rows.append(
+                (
+                    c,
+                    list(repn.linear),
+                    list(repn.linear.values()),
+                    # Pyomo sometimes generates a linear representation
+                    # with an integer constant as a float
+                    int(repn.constant),
+                    c.lb if c.has_lb() else None,
+                    c.ub if c.has_ub() else None,
+                )
+            )
+
+        return rows
+
+    def _reduce_rows(self, rows):
+        """
+        Drop constant rows that are satisfied, turn singleton rows into tightened
+        variable domains, and merge rows with the same linear part, before the
+        rows are translated to CP-SAT.
+        """
+        reduced_rows = []
+        merged_rows = {}
+        var_domains = {}
+
+        for row in rows:
+            c, v_ids, coefs, constant, lb, ub = row
+
+            # Rows with fractional coefficients are left for CP-SAT to reject
+            if not all(float(coef).is_integer() for coef in coefs):
+                reduced_rows.append(row)
+                continue
+
+            # Move the constant into the row bounds; since the row activity is
+            # integral, the bounds can be rounded inwards
+            if lb is not None:
+                lb = math.ceil(lb) - constant
+
+            if ub is not None:
+                ub = math.floor(ub) - constant
+
+            if len(v_ids) == 0:
+                if (lb is None or lb <= 0) and (ub is None or ub >= 0):
+                    continue
+
+                # Infeasible constant rows are kept, so CP-SAT reports infeasibility
+                reduced_rows.append(row)
+
+            elif len(v_ids) == 1:
+                i = self._pyomo_var_to_solver_index[v_ids[0]]
+                coef = int(coefs[0])
+
+                domain = var_domains.get(i, None)
+
+                if domain is None:
+                    domain = cp_model.Domain.from_flat_intervals(
+                        self._solver_model.proto.variables[i].domain
+                    )
+
+                var_lb, var_ub = domain.min(), domain.max()
+
+                if coef > 0:
+                    if lb is not None:
+                        var_lb = max(var_lb, -(-lb // coef))
+                    if ub is not None:
+                        var_ub = min(var_ub, ub // coef)
+                else:
+                    if ub is not None:
+                        var_lb = max(var_lb, -(-ub // coef))
+                    if lb is not None:
+                        var_ub = min(var_ub, lb // coef)
+
+                if var_lb <= var_ub:
+                    domain = domain.intersection_with(cp_model.Domain(var_lb, var_ub))
+
+                if var_lb <= var_ub and not domain.is_empty():
+                    var_domains[i] = domain
+                else:
+                    # Infeasible singleton rows are kept, so CP-SAT reports
+                    # infeasibility
+                    reduced_rows.append(row)
+
             else:
-                cpsat_lb = cp_model.INT_MIN
+                key = tuple(
+                    sorted(
+                        (self._pyomo_var_to_solver_index[v_id], int(coef))
+                        for v_id, coef in zip(v_ids, coefs)
+                    )
+                )
+
+                j = merged_rows.get(key, None)
+
+                if j is None:
+                    merged_rows[key] = len(reduced_rows)
+                    reduced_rows.append((c, v_ids, coefs, 0, lb, ub))
+                    continue
 
-            if c.has_ub():
-                cpsat_ub = c.ub
+                merged_c, merged_v_ids, merged_coefs, _, merged_lb, merged_ub = (
+                    reduced_rows[j]
+                )
+
+                if lb is not None and (merged_lb is None or lb > merged_lb):
+                    merged_lb = lb
+
+                if ub is not None and (merged_ub is None or ub < merged_ub):
+                    merged_ub = ub
+
+                if merged_lb is None or merged_ub is None or merged_lb <= merged_ub:
+                    reduced_rows[j] = (
+                        merged_c,
+                        merged_v_ids,
+                        merged_coefs,
+                        0,
+                        merged_lb,
+                        merged_ub,
+                    )
+                else:
+                    # Conflicting rows are kept, so CP-SAT reports infeasibility
+                    reduced_rows.append(row)
+
+        for i, domain in var_domains.items():
+            self._var_bounds[i] = (domain.min(), domain.max())
+            _set_repeated(
+                self._solver_model.proto.variables[i].domain,
+                domain.flattened_intervals(),
+            )
+
+        return reduced_rows
+
+    def _strict_integer_rows(self, rows):
+        """
+        Validate and convert the coefficients and bounds of all linear rows to
+        integers in bulk. Rows are checked for possible overflow of CP-SAT's
+        64-bit integer arithmetic, and missing row bounds are replaced by the
+        bounds implied by the variable bounds.
+        """
+        if len(rows) == 0:
+            return rows
+
+        lengths = np.fromiter((len(row[1]) for row in rows), np.int64, len(rows))
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+
+        flat_coefs = [coef for row in rows for coef in row[2]]
+        coefs = np.array(flat_coefs, dtype=np.float64)
+        var_indices = np.fromiter(
+            (self._pyomo_var_to_solver_index[v_id] for row in rows for v_id in row[1]),
+            np.int64,
+            offsets[-1],
+        )
+
+        invalid = np.flatnonzero(~(np.isfinite(coefs) & (coefs == np.trunc(coefs))))
+
+        if len(invalid) == 0:
+            # The doubles are only used to find fractional coefficients and to
+            # estimate activities: integral coefficients are converted exactly,
+            # since doubles only hold integers exactly up to 2**53
+            int_coefs = [int(coef) for coef in flat_coefs]
+            invalid = [
+                k
+                for k, coef in enumerate(int_coefs)
+                if coef < cp_model.INT_MIN or coef > cp_model.INT_MAX
+            ]
+
+        if len(invalid) > 0:
+            c = rows[np.searchsorted(offsets, invalid[0], side='right') - 1][0]
+            raise IncompatibleModelError(
+                f'Constraint {c.name} contains a fractional or out of range '
+                'coefficient. CP-SAT cannot solve models with fractional '
+                'coefficients.'
+            )
+
+        var_bounds = np.array(self._var_bounds, dtype=np.float64).reshape(-1, 2)
+        lbs = var_bounds[var_indices, 0]
+        ubs = var_bounds[var_indices, 1]
+
+        # Sum each row's terms, skipping empty rows (np.add.reduceat requires
+        # strictly increasing offsets)
+        nonempty = lengths > 0
+        row_starts = offsets[:-1][nonempty]
+
+        def row_sums(terms):
+            sums = np.zeros(len(rows))
+            if len(row_starts) > 0:
+                sums[nonempty] = np.add.reduceat(terms, row_starts)
+            return sums
+
+        min_activity = row_sums(np.where(coefs > 0, coefs * lbs, coefs * ubs))
+        max_activity = row_sums(np.where(coefs > 0, coefs * ubs, coefs * lbs))
+        max_abs_activity = row_sums(
+            np.abs(coefs) * np.maximum(np.abs(lbs), np.abs(ubs))
+        )
+
+        overflow = np.flatnonzero(max_abs_activity >= 2.0**63)
+
+        if len(overflow) > 0:
+            c = rows[overflow[0]][0]
+            raise IncompatibleModelError(
+                f'Constraint {c.name} may overflow the 64-bit integer arithmetic '
+                'of CP-SAT. Please check its coefficients and variable bounds.'
+            )
+
+        # Activities are exact in double precision below 2**53
+        exact = max_abs_activity < 2.0**53
+
+        strict_rows = []
+
+        for i, (c, v_ids, _, constant, lb, ub) in enumerate(rows):
+            if lb is not None:
+                lb = self._strict_integer_row_bound(c, math.ceil(lb))
+
+            if ub is not None:
+                ub = self._strict_integer_row_bound(c, math.floor(ub))
+
+            if lb is not None and ub is not None and lb > ub:
+                # Fractional bounds rounded inwards may cross. An empty domain
+                # makes the CP-SAT model invalid, so the row is replaced by an
+                # infeasible row without variables instead
+                strict_rows.append((c, [], [], 0, 1, 1))
+                continue
+
+            # Missing bounds are filled with the bounds implied by the variable
+            # bounds, unless these cross the given bound: the row is then
+            # infeasible, and the missing bound is left open
+            if exact[i]:
+                min_lb = int(min_activity[i]) + constant
+                max_ub = int(max_activity[i]) + constant
+
+                if lb is None and (ub is None or min_lb <= ub):
+                    lb = min_lb
+
+                if ub is None and (lb is None or max_ub >= lb):
+                    ub = max_ub
+
+            strict_rows.append(
+                (
+                    c,
+                    v_ids,
+                    int_coefs[offsets[i] : offsets[i + 1]],
+                    constant,
+                    lb,
+                    ub,
+                )
+            )
+
+        return strict_rows
+
+    def _strict_integer_row_bound(self, c, bound):
+        if bound < cp_model.INT_MIN or bound > cp_model.INT_MAX:
+            raise IncompatibleModelError(
+                f'Constraint {c.name} has a bound outside the 64-bit integer range '
+                'supported by CP-SAT.'
+            )
+
+        return bound
+
+    def _circuits(self):
+        """
+        Return the circuits option as a list of tuples (arc_var, depot,
+        constraints).
+        """
+        circuits = []
+
+        for circuit in self._config.circuits or []:
+            if len(circuit) == 2:
+                circuit = (*circuit, [])
+            circuits.append(circuit)
+
+        return circuits
+
+    def _add_circuit(self, arc_var, depot=None):
+        """
+        Add a circuit constraint, or with a depot a multiple circuit constraint,
+        on the arcs (i, j) of a binary Var.
+        """
+        proto = self._solver_model.proto
+
+        # CP-SAT nodes are numbered from 0, the depot
+        nodes = {} if depot is None else {depot: 0}
+
+        tails = []
+        heads = []
+        literals = []
+
+        for index, v in arc_var.items():
+            if not (isinstance(index, tuple) and len(index) == 2):
+                raise ValueError(
+                    f'Variable {v.name} of a circuit is not indexed by an arc (i, j).'
+                )
+
+            literal = self._pyomo_var_to_solver_index[id(v)]
+            lb, ub = self._var_bounds[literal]
+
+            if lb < 0 or ub > 1:
+                raise IncompatibleModelError(
+                    f'Variable {v.name} of a circuit is not binary. '
+                    'CP-SAT circuit constraints are defined on binary arc variables.'
+                )
+
+            i, j = index
+            tails.append(nodes.setdefault(i, len(nodes)))
+            heads.append(nodes.setdefault(j, len(nodes)))
+            literals.append(literal)
+
+        if depot is not None and 0 not in tails:
+            raise ValueError(f'No arcs of {arc_var.name} leave the depot {depot}.')
+
+        cpsat_con = proto.constraints.add()
+        cpsat_con.name = f'{arc_var.name}_circuit'
+
+        circuit = cpsat_con.circuit if depot is None else cpsat_con.routes
+        circuit.tails.extend(tails)
+        circuit.heads.extend(heads)
+        circuit.literals.extend(literals)
+
+    def _add_symmetry_breaking(self, index_set, vars):
+        """
+        Add constraints ordering the vectors of the variables of consecutive
+        elements of an interchangeable index set lexicographically, in
+        non-increasing order.
+        """
+        elements = list(index_set)
+        element_position = {k: n for n, k in enumerate(elements)}
+
+        # Variables of each element, keyed by the Var component and the rest
+        # of the index
+        vectors = [{} for _ in elements]
+
+        for entry, var in enumerate(vars):
+            if isinstance(var, tuple):
+                var, position = var
             else:
-                cpsat_ub = cp_model.INT_MAX
+                position = -1
 
-            cpsat_con = self._solver_model.add_linear_constraint(
-                cpsat_expr, cpsat_lb, cpsat_ub
-            ).with_name(c.name)
+            for index, v in var.items():
+                if not isinstance(index, tuple):
+                    index = (index,)
 
-            if self._config.find_infeasible_subsystem:
-                v = self._solver_model.new_bool_var(f'{c.name}')
-                cpsat_con.only_enforce_if(v)
-                enforcement_literals.append(v)
+                try:
+                    n = element_position[index[position]]
+                except (IndexError, KeyError):
+                    raise ValueError(
+                        f'Variable {v.name} is not indexed by the interchangeable '
+                        'index set at the given position.'
+                    )
 
-        if self._config.find_infeasible_subsystem:
-            self._solver_model.add_assumptions(enforcement_literals)
+                rest = index[:position] + index[position:][1:]
+                vectors[n][entry, rest] = self._pyomo_var_to_solver_index[id(v)]
+
+        keys = list(vectors[0])
 
-    def _set_objective(self):
+        for vector in vectors[1:]:
+            if vector.keys() != vectors[0].keys():
+                raise ValueError(
+                    'The elements of an interchangeable index set must index the '
+                    'same variables.'
+                )
+
+        for a, b in zip(vectors[:-1], vectors[1:]):
+            self._add_lex_greater_equal(
+                [a[key] for key in keys], [b[key] for key in keys]
+            )
+
+    def _add_lex_greater_equal(self, a, b):
+        """
+        Add constraints ensuring that the vector of CP-SAT variables (proto
+        indices) a is lexicographically greater than or equal to b.
+        """
+        # prefix_equal is a literal that is true if a and b are equal before
+        # position i; if it is false, a is greater than b before position i
+        prefix_equal = None
+
+        for i, (a_i, b_i) in enumerate(zip(a, b)):
+            literals = [] if prefix_equal is None else [prefix_equal]
+
+            self._add_linear_row([a_i, b_i], [1, -1], 0, cp_model.INT_MAX, literals)
+
+            if i == len(a) - 1:
+                break
+
+            equal = self._add_bool_var()
+            self._add_linear_row(
+                [a_i, b_i], [1, -1], 1, cp_model.INT_MAX, literals + [-equal - 1]
+            )
+
+            if prefix_equal is not None:
+                implication = self._solver_model.proto.constraints.add()
+                implication.enforcement_literal.append(equal)
+                implication.bool_and.literals.append(prefix_equal)
+
+            prefix_equal = equal
+
+    def _add_bool_var(self, name=''):
+        """
+        Add a Boolean variable to the CP-SAT model, and return its proto index.
+        """
+        proto = self._solver_model.proto
+        index = len(proto.variables)
+
+        cpsat_var = proto.variables.add()
+        cpsat_var.name = name
+        cpsat_var.domain.extend((0, 1))
+
+        return index
+
+    def _add_linear_row(self, indices, coefs, lb, ub, enforcement_literals=(), name=''):
+        """
+        Add the constraint lb <= sum(coefs[k] * x[indices[k]]) <= ub to the
+        CP-SAT model, enforced by the given literals.
+        """
+        cpsat_con = self._solver_model.proto.constraints.add()
+        cpsat_con.name = name
+        cpsat_con.enforcement_literal.extend(enforcement_literals)
+        cpsat_con.linear.vars.extend(indices)
+        cpsat_con.linear.coeffs.extend(coefs)
+        cpsat_con.linear.domain.extend((lb, ub))
+
+        return cpsat_con
+
+    def _set_objective(self, obj=None):
         if self._config.find_infeasible_subsystem:
             return
 
-        obj = get_objective(self._model)
+        if obj is None:
+            obj = get_objective(self._model)
 
         if obj is None:
             raise ValueError('No active objectives to add to solver.')
 
-        # If we set quadratic=False in generate_standard_repn(),
-        # we only need to check for nonlinear expressions
-        repn = generate_standard_repn(obj.expr, quadratic=False)
+        repn = self._repn_visitor.walk_expression(obj.expr)
 
-        if repn.nonlinear_expr is not None:
+        if repn.nonlinear is not None:
             raise IncompatibleModelError(
                 f'Objective {obj.name} contains a nonlinear expression. '
                 'CP-SAT cannot solve models with a nonlinear objective.'
             )
 
-        if len(repn.linear_vars) > 0:
-            cpsat_expr = cp_model.LinearExpr.weighted_sum(
-                [self._pyomo_var_to_solver_var_map[id(v)] for v in repn.linear_vars],
-                repn.linear_coefs,
+        if obj.sense not in [minimize, maximize]:
+            raise ValueError(f'Objective sense {obj.sense} is not recognized.')
+
+        self._objective = obj
+        self._objective_scaling = None
+
+        proto = self._solver_model.proto
+        _clear_field(proto, 'objective')
+        _clear_field(proto, 'floating_point_objective')
+
+        indices = [self._pyomo_var_to_solver_index[v_id] for v_id in repn.linear]
+        coefs = list(repn.linear.values())
+
+        if self._config.scale_objective:
+            scale, scaled_coefs = self._scale_objective_coefs(obj, coefs)
+
+            # The integer objective is scaled back by the scaling factor, so
+            # CP-SAT reports values in the units of the model
+            sign = 1 if obj.sense == minimize else -1
+
+            proto.objective.vars.extend(indices)
+            proto.objective.coeffs.extend([sign * coef for coef in scaled_coefs])
+            proto.objective.offset = sign * scale * repn.constant
+            proto.objective.scaling_factor = sign / scale
+
+            if self._config.objective_precision is None:
+                # Scaled exactly: values are computed from the scaled coefficients
+                self._objective_scaling = (
+                    scale,
+                    True,
+                    indices,
+                    scaled_coefs,
+                    repn.constant,
+                )
+            else:
+                self._objective_scaling = (scale, False, indices, coefs, repn.constant)
+        elif all(isinstance(coef, int) for coef in coefs) and isinstance(
+            repn.constant, int
+        ):
+            # CP-SAT minimizes: maximization objectives are negated, and scaled
+            # back by a scaling factor of -1
+            sign = 1 if obj.sense == minimize else -1
+
+            proto.objective.vars.extend(indices)
+            proto.objective.coeffs.extend([sign * coef for coef in coefs])
+            proto.objective.offset = sign * repn.constant
+            proto.objective.scaling_factor = sign
+        else:
+            proto.floating_point_objective.vars.extend(indices)
+            proto.floating_point_objective.coeffs.extend(coefs)
+            proto.floating_point_objective.offset = repn.constant
+            proto.floating_point_objective.maximize = obj.sense == maximize
+
+        return repn
+
+    def _scale_objective_coefs(self, obj, coefs):
+        """
+        Return the factor scaling the objective coefficients to integers, and
+        the scaled coefficients.
+        """
+        precision = self._config.objective_precision
+
+        if precision is not None:
+            scale = 1 / precision
+            if abs(scale - round(scale)) < 1e-9 * scale:
+                scale = round(scale)
+
+            return scale, [round(coef * scale) for coef in coefs]
+
+        # Each coefficient is converted to the nearest fraction with a small
+        # denominator, which must round to the coefficient
+        fracs = []
+
+        for coef in coefs:
+            frac = fractions.Fraction(coef).limit_denominator(
+                _MAX_OBJECTIVE_DENOMINATOR
             )
+
+            if float(frac) != coef:
+                raise IncompatibleModelError(
+                    f'Objective {obj.name} contains a coefficient that is not a '
+                    'fraction with a small denominator. Set objective_precision to '
+                    'scale the objective approximately.'
+                )
+
+            fracs.append(frac)
+
+        scale = math.lcm(*(frac.denominator for frac in fracs))
+
+        if scale > _MAX_OBJECTIVE_SCALE:
+            raise IncompatibleModelError(
+                f'Objective {obj.name} cannot be scaled to integer coefficients '
+                'exactly. Set objective_precision to scale the objective '
+                'approximately.'
+            )
+
+        return scale, [int(frac * scale) for frac in fracs]
+
+    def _optimize_model(self):
+        """
+        Set the objective and optimize the translated model, and return a dict
+        of entries to add to the extra_info of the results.
+        """
+        timer = self._config.timer
+
+        if self._config.decomposition is not None:
+            timer.start('set_objective')
+            self._set_objective()
+            timer.stop('set_objective')
+
+            return {'decomposition_groups': self._optimize_decomposed()}
+
+        if (
+            self._config.lexicographic_objectives is not None
+            and not self._config.find_infeasible_subsystem
+        ):
+            return {'lexicographic_objective_values': self._optimize_lexicographic()}
+
+        timer.start('set_objective')
+        self._set_objective()
+        timer.stop('set_objective')
+
+        self._optimize()
+
+        return {}
+
+    def _presolve_model(self):
+        """
+        Set the objective and run only the presolve of CP-SAT on the translated
+        model, and return the presolve statistics as entries of extra_info.
+        """
+        timer = self._config.timer
+
+        timer.start('set_objective')
+        self._set_objective()
+        timer.stop('set_objective')
+
+        parameters = self._solver_solver.parameters
+        parameters.stop_after_presolve = True
+        parameters.fill_tightened_domains_in_response = True
+
+        # The size of the presolved model is only reported in the search log
+        parameters.log_search_progress = True
+        parameters.log_to_response = True
+
+        self._optimize()
+
+        proto = self._solver_model.proto
+        response = self._solver_response
+
+        presolve_stats = {
+            'num_variables': len(proto.variables),
+            'num_constraints': len(proto.constraints),
+            'num_terms': sum(len(con.linear.vars) for con in proto.constraints),
+        }
+
+        for key, val in re.findall(
+            r'^PresolvedNum(Variables|Constraints|Terms): (\d+)$',
+            response.solve_log,
+            flags=re.MULTILINE,
+        ):
+            presolve_stats[f'presolved_num_{key.lower()}'] = int(val)
+
+        tightened_vars = response.tightened_variables
+
+        presolve_stats['num_fixed_variables'] = sum(
+            1
+            for var in tightened_vars
+            if len(var.domain) == 2 and var.domain[0] == var.domain[1]
+        )
+        presolve_stats['num_tightened_variables'] = sum(
+            1
+            for var, tightened_var in zip(proto.variables, tightened_vars)
+            if list(var.domain) != list(tightened_var.domain)
+        )
+
+        extra_info = {'presolve_stats': presolve_stats}
+
+        if self._config.presolve_tightened_model:
+            tightened_model = type(proto)()
+            _copy_proto(tightened_model, proto)
+
+            for var, tightened_var in zip(tightened_model.variables, tightened_vars):
+                _set_repeated(var.domain, list(tightened_var.domain))
+
+            extra_info['presolve_tightened_model'] = tightened_model
+
+        return extra_info
+
+    def _optimize(self):
+        timer = self._config.timer
+
+        timeline = self._progress_timeline
+
+        if timeline is None:
+            solution_callback = None
+            self._solver_solver.best_bound_callback = None
         else:
-            cpsat_expr = 0
+            solution_callback = timeline.solution_callback()
+            self._solver_solver.best_bound_callback = timeline.record_bound
+
+        self._solver_solver.log_callback = self._log_callback()
 
-        cpsat_expr += repn.constant
+        timer.start('optimize')
+        with _cancellable(self._config.cancellation_token, self._solver_solver):
+            self._solver_status = self._solver_solver.solve(
+                self._solver_model, solution_callback
+            )
+        timer.stop('optimize')
+
+        self._solver_response = self._solver_solver.response_proto
+        self._deterministic_time += self._solver_response.deterministic_time
+
+        if timeline is not None and self._solver_status in [
+            cp_model.OPTIMAL,
+            cp_model.FEASIBLE,
+        ]:
+            # The final bound is not always reported by the callbacks
+            timeline.record(
+                self._solver_response.objective_value,
+                self._solver_response.best_objective_bound,
+            )
+
+    def _cancelled(self):
+        """
+        Return True if the cancellation token of this solve has been cancelled.
+        """
+        token = self._config.cancellation_token
+        return token is not None and token.cancelled
+
+    def _log_callback(self):
+        """
+        Return a CP-SAT log callback writing the log to the tee streams, or None
+        if there are none.
+        """
+        ostreams = self._config.tee
+
+        if not ostreams:
+            return None
+
+        def log_callback(message):
+            for ostream in ostreams:
+                ostream.write(message + '\n')
+
+        return log_callback
+
+    def _optimize_decomposed(self):
+        """
+        Split the CP-SAT model into independent groups of variables and
+        constraints, solve the groups in parallel, and merge their responses.
+        """
+        timer = self._config.timer
+
+        timer.start('decompose')
+        groups, sub_protos = self._decompose()
+        timer.stop('decompose')
+
+        responses = self._optimize_protos(
+            sub_protos, self._workers_per_model(len(groups))
+        )
+
+        self._solver_response = self._merge_responses(groups, responses)
+        self._solver_status = self._solver_response.status
+
+        return len(groups)
+
+    def _auto_num_workers(self):
+        """
+        Choose the number of CP-SAT workers from the number of variables and
+        constraint terms of the translated model.
+        """
+        proto = self._solver_model.proto
+        size = len(proto.variables) + sum(
+            len(con.linear.vars) for con in proto.constraints
+        )
+
+        num_workers = next(n for max_size, n in _AUTO_NUM_WORKERS if size < max_size)
+
+        return max(1, min(num_workers, os.cpu_count() or 1))
+
+    def _workers_per_model(self, num_models):
+        """
+        Share the available threads between CP-SAT models solved in parallel.
+        """
+        threads = self._solver_solver.parameters.num_workers or os.cpu_count() or 1
+        return max(1, threads // num_models)
+
+    def _optimize_protos(self, protos, num_workers):
+        """
+        Solve CP-SAT model protos in parallel, each with a new CP-SAT solver using
+        the parameters of this solve and num_workers threads, and return their
+        CP-SAT responses.
+        """
+        timer = self._config.timer
+
+        # The models are solved in other threads, where the state of this solve
+        # is not available
+        parameters = self._solver_solver.parameters
+        log_callback = self._log_callback()
+        token = self._config.cancellation_token
+
+        def solve_proto(proto):
+            sub_model = cp_model.CpModel()
+            _copy_proto(sub_model.proto, proto)
+
+            sub_solver = cp_model.CpSolver()
+            _copy_proto(sub_solver.parameters, parameters)
+            sub_solver.parameters.num_workers = num_workers
+            sub_solver.log_callback = log_callback
+
+            with _cancellable(token, sub_solver):
+                sub_solver.solve(sub_model)
+
+            return sub_solver.response_proto
+
+        timer.start('optimize')
+        with ThreadPoolExecutor(max_workers=len(protos)) as executor:
+            responses = list(executor.map(solve_proto, protos))
+        timer.stop('optimize')
+
+        self._deterministic_time += sum(r.deterministic_time for r in responses)
+
+        return responses
+
+    def _decompose(self):
+        """
+        Find the connected components of the variable/constraint incidence graph
+        of the CP-SAT model (with the variables of each top-level block joined
+        if decomposition is 'blocks'), pack them into at most
+        decomposition_workers groups, and build a CP-SAT model for each group.
+        """
+        proto = self._solver_model.proto
+        num_vars = len(proto.variables)
+        parent = list(range(num_vars))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def join(indices):
+            if len(indices) > 0:
+                root = find(indices[0])
+                for i in indices[1:]:
+                    parent[find(i)] = root
+
+        if self._config.decomposition == 'blocks':
+            blocks = self._model.component_data_objects(
+                Block, active=True, descend_into=False
+            )
+            for block in blocks:
+                join(
+                    [
+                        self._pyomo_var_to_solver_index[id(v)]
+                        for v in block.component_data_objects(Var, descend_into=True)
+                    ]
+                )
+
+        # Negative references are the negations of Boolean variables
+        for con in proto.constraints:
+            join([r if r >= 0 else -r - 1 for r in _proto_constraint_vars(con)])
+
+        components = {}
+        for i in range(num_vars):
+            components.setdefault(find(i), []).append(i)
+
+        # Pack the components into groups of similar size, largest first; a model
+        # without variables is solved as a single empty group
+        num_groups = max(
+            1,
+            min(
+                len(components),
+                self._config.decomposition_workers or os.cpu_count() or 1,
+            ),
+        )
+        groups = [[] for _ in range(num_groups)]
+        group_sizes = [(0, g) for g in range(num_groups)]
+
+        for component in sorted(components.values(), key=len, reverse=True):
+            size, g = heapq.heappop(group_sizes)
+            groups[g].extend(component)
+            heapq.heappush(group_sizes, (size + len(component), g))
+
+        group_of = [0] * num_vars
+        new_index = [0] * num_vars
+
+        for g, group in enumerate(groups):
+            group.sort()
+            for k, i in enumerate(group):
+                group_of[i] = g
+                new_index[i] = k
+
+        def remap(refs):
+            return [new_index[r] if r >= 0 else -new_index[-r - 1] - 1 for r in refs]
+
+        sub_protos = [type(proto)() for _ in groups]
+
+        for sub_proto, group in zip(sub_protos, groups):
+            for i in group:
+                _copy_proto(sub_proto.variables.add(), proto.variables[i])
+
+        for con in proto.constraints:
+            refs = _proto_constraint_vars(con)
+            g = group_of[refs[0] if refs[0] >= 0 else -refs[0] - 1] if refs else 0
+
+            sub_con = sub_protos[g].constraints.add()
+            _copy_proto(sub_con, con)
+            _set_repeated(sub_con.enforcement_literal, remap(con.enforcement_literal))
+
+            kind = _constraint_kind(con)
+            if kind in _CONSTRAINT_REF_FIELDS:
+                field = _CONSTRAINT_REF_FIELDS[kind]
+                _set_repeated(
+                    getattr(getattr(sub_con, kind), field),
+                    remap(getattr(getattr(con, kind), field)),
+                )
+
+        # The objective offset is kept in the first group only, so the objective
+        # values and bounds of the groups add up to those of the full model
+        for field in ['objective', 'floating_point_objective']:
+            if not _has_field(proto, field):
+                continue
+
+            objective = getattr(proto, field)
+
+            for g, sub_proto in enumerate(sub_protos):
+                sub_objective = getattr(sub_proto, field)
+                _copy_proto(sub_objective, objective)
+                _set_repeated(sub_objective.vars, [])
+                _set_repeated(sub_objective.coeffs, [])
+                if g > 0:
+                    sub_objective.offset = 0
+
+            for ref, coef in zip(objective.vars, objective.coeffs):
+                i = ref if ref >= 0 else -ref - 1
+                sub_objective = getattr(sub_protos[group_of[i]], field)
+                sub_objective.vars.extend(remap([ref]))
+                sub_objective.coeffs.append(coef)
+
+        for ref, val in zip(proto.solution_hint.vars, proto.solution_hint.values):
+            i = ref if ref >= 0 else -ref - 1
+            sub_hint = sub_protos[group_of[i]].solution_hint
+            sub_hint.vars.extend(remap([ref]))
+            sub_hint.values.append(val)
+
+        return groups, sub_protos
+
+    def _merge_responses(self, groups, responses):
+        """
+        Merge the CP-SAT responses of the groups of a decomposed model into a
+        single response for the full model.
+        """
+        response = type(responses[0])()
+
+        # The status of the full model is the worst status of the groups
+        status_order = [
+            cp_model.MODEL_INVALID,
+            cp_model.INFEASIBLE,
+            cp_model.UNKNOWN,
+            cp_model.FEASIBLE,
+            cp_model.OPTIMAL,
+        ]
+        response.status = min((r.status for r in responses), key=status_order.index)
+
+        if response.status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+            solution = [0] * len(self._solver_model.proto.variables)
+            for group, r in zip(groups, responses):
+                for i, val in zip(group, r.solution):
+                    solution[i] = val
+            response.solution.extend(solution)
+
+        response.objective_value = sum(r.objective_value for r in responses)
+        response.best_objective_bound = sum(r.best_objective_bound for r in responses)
+        response.wall_time = max(r.wall_time for r in responses)
+
+        return response
+
+    def _optimize_lexicographic(self):
+        """
+        Optimize the lexicographic objectives in order on the same CP-SAT model,
+        and return the objective value found in each stage.
+        """
+        timer = self._config.timer
+        objectives = self._config.lexicographic_objectives
+
+        if len(objectives) == 0:
+            raise ValueError('No lexicographic objectives to add to solver.')
+
+        stage_values = []
+        all_stages_optimal = True
+
+        for i, obj in enumerate(objectives):
+            timer.start('set_objective')
+            repn = self._set_objective(obj)
+            timer.stop('set_objective')
+
+            self._optimize()
+
+            if self._solver_status not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+                break
+
+            if self._solver_status != cp_model.OPTIMAL:
+                all_stages_optimal = False
+
+            stage_values.append(self._solver_solver.objective_value)
+
+            # The later stages are skipped
+            if i < len(objectives) - 1 and self._cancelled():
+                all_stages_optimal = False
+                break
+
+            if i < len(objectives) - 1:
+                timer.start('fix_objective')
+                self._fix_objective(obj, repn)
+                self._add_solution_hint()
+                timer.stop('fix_objective')
+
+        # The final stage is only optimal if every earlier stage was
+        if self._solver_status == cp_model.OPTIMAL and not all_stages_optimal:
+            self._solver_status = cp_model.FEASIBLE
+
+        return stage_values
+
+    def _fix_objective(self, obj, repn):
+        """
+        Constrain a lexicographic objective to its value in the current solution,
+        up to lexicographic_tolerance.
+        """
+        if len(repn.linear) == 0:
+            return
+
+        if self._objective_scaling is not None:
+            # Scaled objectives are constrained with the integer coefficients
+            # passed to CP-SAT, and the tolerance is scaled alike
+            scale, exact, indices, coefs, _ = self._objective_scaling
+            if not exact:
+                coefs = [round(coef * scale) for coef in coefs]
+        else:
+            if not all(float(coef).is_integer() for coef in repn.linear.values()):
+                raise IncompatibleModelError(
+                    f'Objective {obj.name} contains a fractional coefficient. '
+                    'CP-SAT cannot constrain lexicographic objectives with '
+                    'fractional coefficients unless scale_objective is set.'
+                )
+
+            scale = 1
+            indices = [self._pyomo_var_to_solver_index[v_id] for v_id in repn.linear]
+            coefs = [int(coef) for coef in repn.linear.values()]
+
+        solution = self._solver_response.solution
+        stage_value = sum(coef * solution[i] for coef, i in zip(coefs, indices))
+        tol = math.floor(round(self._config.lexicographic_tolerance * scale, 9))
 
         if obj.sense == minimize:
-            self._solver_model.minimize(cpsat_expr)
-        elif obj.sense == maximize:
-            self._solver_model.maximize(cpsat_expr)
+            cpsat_lb = cp_model.INT_MIN
+            cpsat_ub = stage_value + tol
         else:
-            raise ValueError(f'Objective sense {obj.sense} is not recognized.')
+            cpsat_lb = stage_value - tol
+            cpsat_ub = cp_model.INT_MAX
+
+        self._add_linear_row(
+            indices, coefs, cpsat_lb, cpsat_ub, name=f'{obj.name}_lexicographic'
+        )
+
+    def _add_solution_hint(self):
+        """
+        Pass the current solution to CP-SAT as a hint for the next solve.
+        """
+        proto = self._solver_model.proto
+        num_vars = len(self._vars)
+
+        _clear_field(proto, 'solution_hint')
+        proto.solution_hint.vars.extend(range(num_vars))
+        proto.solution_hint.values.extend(
+            list(self._solver_response.solution)[:num_vars]
+        )
 
     def _load_results(self):
+        # With objective_precision, CP-SAT optimizes the rounded objective, whose
+        # optimal solutions are only feasible for the objective of the model
+        if (
+            self._solver_status == cp_model.OPTIMAL
+            and self._objective_rounding_error() > 0
+        ):
+            self._solver_status = cp_model.FEASIBLE
+
         results = Results()
         results.solver_name = 'CP-SAT'
         results.solver_version = self.version()
         results.solver_config = self._config
-        results.solution_loader = CpsatSolutionLoader(
-            self._solver_solver, self._vars, self._pyomo_var_to_solver_var_map
-        )
-        results.timing_info.cpsat_time = self._solver_solver.wall_time
+        results.solution_loader = self._solution_loader()
+        results.timing_info.cpsat_time = self._solver_response.wall_time
 
         # CP-SAT solver status: google/or-tools/ortools/sat/cp_model.proto
         if self._solver_status == cp_model.UNKNOWN:
             results.solution_status = SolutionStatus.noSolution
-            results.termination_condition = TerminationCondition.unknown
+            if self._cancelled():
+                results.termination_condition = TerminationCondition.interrupted
+            else:
+                results.termination_condition = TerminationCondition.unknown
         elif self._solver_status == cp_model.MODEL_INVALID:
             results.solution_status = SolutionStatus.noSolution
             results.termination_condition = TerminationCondition.error
@@ -452,7 +2200,7 @@ class Cpsat(SolverBase):
         else:
             raise ValueError('CP-SAT terminated with invalid solver status.')
 
-        if not self._config.find_infeasible_subsystem:
+        if not (self._config.find_infeasible_subsystem or self._config.presolve_only):
             if (
                 results.solution_status != SolutionStatus.optimal
                 and self._config.raise_exception_on_nonoptimal_result
@@ -465,14 +2213,91 @@ class Cpsat(SolverBase):
                 else:
                     raise NoFeasibleSolutionError
 
-        results.incumbent_objective = self._solver_solver.objective_value
-        results.objective_bound = self._solver_solver.best_objective_bound
+        results.incumbent_objective = self._solver_response.objective_value
+        results.objective_bound = self._solver_response.best_objective_bound
+
+        if self._objective_scaling is not None:
+            self._unscale_objective(results)
 
         return results
 
+    def _unscale_objective(self, results):
+        """
+        Report the objective value and bound of a scaled objective exactly: the
+        objective value from the solution and the coefficients of the model, and
+        the bound from the integral bound of the scaled objective.
+        """
+        scale, exact, indices, coefs, constant = self._objective_scaling
+        response = self._solver_response
+        objective = self._solver_model.proto.objective
+
+        def unscale(scaled_value):
+            if exact:
+                return float(
+                    fractions.Fraction(scaled_value, scale)
+                    + fractions.Fraction(constant)
+                )
+            return scaled_value / scale + constant
+
+        if self._solver_status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+            solution = response.solution
+
+            if exact:
+                results.incumbent_objective = unscale(
+                    sum(coef * solution[i] for coef, i in zip(coefs, indices))
+                )
+            else:
+                results.incumbent_objective = (
+                    math.fsum(coef * solution[i] for coef, i in zip(coefs, indices))
+                    + constant
+                )
+
+        if math.isfinite(response.best_objective_bound):
+            sign = 1 if objective.scaling_factor > 0 else -1
+            scaled_bound = round(
+                response.best_objective_bound / objective.scaling_factor
+                - objective.offset
+            )
+            results.objective_bound = unscale(sign * scaled_bound)
+
+            # The bound of the rounded objective is widened by the largest
+            # difference between the rounded objective and the objective
+            error = self._objective_rounding_error()
+
+            if self._objective.sense == minimize:
+                results.objective_bound -= error
+            else:
+                results.objective_bound += error
+
+    def _objective_rounding_error(self):
+        """
+        Return a bound on the difference between the objective of the model and
+        the objective passed to CP-SAT with coefficients rounded to
+        objective_precision, over the bounds of the variables.
+        """
+        if self._objective_scaling is None:
+            return 0
+
+        scale, exact, indices, coefs, _ = self._objective_scaling
+
+        if exact:
+            return 0
+
+        return math.fsum(
+            abs(round(coef * scale) / scale - coef) * max(map(abs, self._var_bounds[i]))
+            for coef, i in zip(coefs, indices)
+        )
+
+    def _solution_loader(self):
+        return CpsatSolutionLoader(
+            self._solver_response.solution,
+            self._vars,
+            self._pyomo_var_to_solver_index,
+        )
+
     def _output_infeasible_subsystem(self):
         print('Infeasible subsystem of constraints')
         print('-----------------------------------')
         for i in self._solver_solver.sufficient_assumptions_for_infeasibility():
-            print(self._solver_model.get_bool_var_from_proto_index(i).name)
+            print(self._solver_model.proto.variables[i].name)
         print('')
@@ -0,0 +1,317 @@
+from typing import Optional
+
+from pyomo.common.config import (
+    document_kwargs_from_configdict,
+    ConfigValue,
+    Bool,
+    PositiveInt,
+)
+from pyomo.core.base.block import BlockData
+from pyomo.core.kernel.objective import minimize
+from pyomo.contrib.solver.common.results import Results
+
+from .cpsat import (
+    Cpsat,
+    CpsatConfig,
+    cp_model,
+    _clear_field,
+    _copy_proto,
+    _set_repeated,
+)
+
+
+class LargeNeighborhoodSearchConfig(CpsatConfig):
+    """ """
+
+    def __init__(
+        self,
+        description=None,
+        doc=None,
+        implicit=False,
+        implicit_domain=None,
+        visibility=0,
+    ):
+        super().__init__(
+            description=description,
+            doc=doc,
+            implicit=implicit,
+            implicit_domain=implicit_domain,
+            visibility=visibility,
+        )
+
+        # A large neighborhood search solution is not proven optimal
+        self.get('raise_exception_on_nonoptimal_result').set_default_value(False)
+
+        self.neighborhoods: Optional[list] = self.declare(
+            'neighborhoods',
+            ConfigValue(
+                domain=list,
+                default=None,
+                description='List of neighborhoods, each a collection of Pyomo '
+                'variables (VarData or Var components) that are free in the '
+                'neighborhood; all other variables are fixed to the incumbent '
+                'solution. Required.',
+            ),
+        )
+
+        self.use_initial_values: bool = self.declare(
+            'use_initial_values',
+            ConfigValue(
+                domain=Bool,
+                default=False,
+                description='If True, the current values of the Pyomo variables are '
+                'used as the initial incumbent, instead of an initial CP-SAT solve. '
+                'If the values are not a feasible solution, the initial CP-SAT '
+                'solve is used, with the values as a hint.',
+            ),
+        )
+
+        self.lns_rounds: int = self.declare(
+            'lns_rounds',
+            ConfigValue(
+                domain=PositiveInt,
+                default=1,
+                description='Number of passes over the neighborhoods.',
+            ),
+        )
+
+        self.lns_workers: int = self.declare(
+            'lns_workers',
+            ConfigValue(
+                domain=PositiveInt,
+                default=1,
+                description='Number of neighborhoods solved in parallel. With 1, '
+                'each neighborhood is solved on the CP-SAT model of the initial '
+                'solve; otherwise, each neighborhood is solved on a copy. The '
+                'threads (num_workers) of CP-SAT are shared between the '
+                'neighborhoods solved in parallel.',
+            ),
+        )
+
+
+class LargeNeighborhoodSearch(Cpsat):
+    """
+    Large neighborhood search driver for CP-SAT with user-defined neighborhoods
+
+    The model is translated to CP-SAT once and solved to find an initial
+    incumbent. Each neighborhood is then solved with the variables outside the
+    neighborhood fixed to the incumbent through their CP-SAT domains and the
+    incumbent passed as a hint; improving solutions become the new incumbent.
+    The time_limit and other CP-SAT options apply to the initial solve and to
+    each neighborhood.
+    """
+
+    CONFIG = LargeNeighborhoodSearchConfig()
+
+    @document_kwargs_from_configdict(CONFIG)
+    def solve(self, model: BlockData, **kwargs) -> Results:
+        """
+        Solve a Pyomo model with CP-SAT, improving the solution by large
+        neighborhood search.
+
+        Parameters
+        ----------
+        model: BlockData
+            The Pyomo model to be solved
+        **kwargs
+            Additional keyword arguments (including solver_options - passthrough
+            options; delivered directly to the solver (with no validation))
+
+        Returns
+        -------
+        results: :class:`Results<pyomo.contrib.solver.common.results.Results>`
+            A results object. The incumbent objective value after the initial
+            solve and after each batch of neighborhoods is in
+            extra_info.lns_objective_values.
+        """
+        return super().solve(model, **kwargs)
+
+    def _optimize_model(self):
+        if self._config.neighborhoods is None:
+            raise ValueError('No neighborhoods given for large neighborhood search.')
+
+        if (
+            self._config.find_infeasible_subsystem
+            or self._config.lexicographic_objectives is not None
+            or self._config.decomposition is not None
+        ):
+            raise ValueError(
+                'Large neighborhood search cannot be combined with '
+                'find_infeasible_subsystem, lexicographic_objectives or '
+                'decomposition.'
+            )
+
+        timer = self._config.timer
+
+        timer.start('set_objective')
+        self._set_objective()
+        timer.stop('set_objective')
+
+        if self._config.use_initial_values:
+            self._optimize_initial_values()
+        else:
+            self._optimize()
+
+        objective_values = []
+
+        if self._solver_status != cp_model.FEASIBLE:
+            # Nothing to improve: either optimal or no incumbent
+            if self._solver_status == cp_model.OPTIMAL:
+                objective_values.append(self._solver_response.objective_value)
+            return {'lns_objective_values': objective_values}
+
+        neighborhoods = [
+            sorted(
+                set(
+                    self._pyomo_var_to_solver_index[id(v)]
+                    for item in neighborhood
+                    for v in (item.values() if item.is_indexed() else [item])
+                )
+            )
+            for neighborhood in self._config.neighborhoods
+        ]
+
+        proto = self._solver_model.proto
+        original_domains = [list(var.domain) for var in proto.variables]
+
+        incumbent = self._solver_response
+        best_objective_bound = incumbent.best_objective_bound
+        objective_values.append(incumbent.objective_value)
+
+        batch_size = self._config.lns_workers
+
+        for _ in range(self._config.lns_rounds):
+            for k in range(0, len(neighborhoods), batch_size):
+                if self._cancelled():
+                    break
+
+                batch = neighborhoods[k : k + batch_size]
+
+                timer.start('fix_neighborhoods')
+                if len(batch) == 1:
+                    self._fix_neighborhood(
+                        proto, batch[0], incumbent.solution, original_domains
+                    )
+                    batch_protos = None
+                else:
+                    batch_protos = []
+                    for neighborhood in batch:
+                        batch_proto = type(proto)()
+                        _copy_proto(batch_proto, proto)
+                        self._fix_neighborhood(
+                            batch_proto,
+                            neighborhood,
+                            incumbent.solution,
+                            original_domains,
+                        )
+                        batch_protos.append(batch_proto)
+                timer.stop('fix_neighborhoods')
+
+                if batch_protos is None:
+                    self._optimize()
+                    responses = [self._solver_response]
+                else:
+                    responses = self._optimize_protos(
+                        batch_protos, self._workers_per_model(len(batch_protos))
+                    )
+
+                for response in responses:
+                    if response.status in [
+                        cp_model.OPTIMAL,
+                        cp_model.FEASIBLE,
+                    ] and self._is_improvement(response, incumbent):
+                        incumbent = response
+
+                objective_values.append(incumbent.objective_value)
+
+        for var, domain in zip(proto.variables, original_domains):
+            _set_repeated(var.domain, domain)
+
+        # Neighborhood bounds are not bounds for the full model
+        self._solver_response = type(incumbent)()
+        _copy_proto(self._solver_response, incumbent)
+        self._solver_response.best_objective_bound = best_objective_bound
+        self._solver_status = cp_model.FEASIBLE
+
+        return {'lns_objective_values': objective_values}
+
+    def _optimize_initial_values(self):
+        """
+        Use the current values of the Pyomo variables as the initial incumbent.
+        The values are checked by solving the CP-SAT model with every variable
+        fixed to its value. If they are not a feasible solution, the CP-SAT
+        model is solved instead.
+        """
+        proto = self._solver_model.proto
+        original_domains = [list(var.domain) for var in proto.variables]
+
+        values = []
+
+        for v, domain in zip(self._vars, original_domains):
+            if v.value is None:
+                raise ValueError(
+                    f'Variable ({v.name}) has no value to use as initial incumbent.'
+                )
+
+            val = v.value
+
+            if not float(val).is_integer() or not any(
+                lb <= val <= ub for lb, ub in zip(domain[::2], domain[1::2])
+            ):
+                values = None
+                break
+
+            values.append(int(val))
+
+        if values is not None:
+            self._fix_neighborhood(proto, [], values, original_domains)
+            self._optimize()
+
+            for var, domain in zip(proto.variables, original_domains):
+                _set_repeated(var.domain, domain)
+
+            if self._solver_status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+                # The values are optimal for the fixed model only
+                response = type(self._solver_response)()
+                _copy_proto(response, self._solver_response)
+                response.status = cp_model.FEASIBLE
+
+                if self._objective.sense == minimize:
+                    response.best_objective_bound = -float('inf')
+                else:
+                    response.best_objective_bound = float('inf')
+
+                self._solver_response = response
+                self._solver_status = cp_model.FEASIBLE
+                return
+
+            if self._cancelled():
+                return
+
+        self._optimize()
+
+    def _fix_neighborhood(self, proto, neighborhood, solution, original_domains):
+        """
+        Free the variables of a neighborhood in a CP-SAT model proto, fix all
+        other variables of the Pyomo model to the given solution, and hint the
+        solution. Auxiliary CP-SAT variables (e.g. of symmetry-breaking
+        constraints) are always free.
+        """
+        free = set(neighborhood)
+        num_vars = len(self._vars)
+
+        for i, var in enumerate(proto.variables):
+            if i in free or i >= num_vars:
+                _set_repeated(var.domain, original_domains[i])
+            else:
+                _set_repeated(var.domain, [solution[i], solution[i]])
+
+        _clear_field(proto, 'solution_hint')
+        proto.solution_hint.vars.extend(range(num_vars))
+        proto.solution_hint.values.extend(list(solution)[:num_vars])
+
+    def _is_improvement(self, response, incumbent):
+        if self._objective.sense == minimize:
+            return response.objective_value < incumbent.objective_value
+        else:
+            return response.objective_value > incumbent.objective_value
@@ -0,0 +1,101 @@
+from typing import Optional, Sequence, NoReturn
+
+from pyomo.core.base.var import Var, VarData
+from pyomo.core.base.block import BlockData
+from pyomo.core.staleflag import StaleFlagManager
+
+from pyomo.common.dependencies import attempt_import, numpy as np
+from pyomo.contrib.solver.common.util import NoFeasibleSolutionError
+
+cp_model, _ = attempt_import('ortools.sat.python.cp_model')
+
+# Layout of a solution file, as 64-bit integers: CP-SAT status, number of
+# variables, objective value and best objective bound (as 64-bit floats), and
+# the values of the variables in the order of the Cpsat interface
+_HEADER_LENGTH = 4
+
+
+def _write_solution_file(
+    path, num_vars, status, objective_value, best_objective_bound, solution
+):
+    """
+    Write the status, objective value, best objective bound and solution (empty
+    if none was found) of a CP-SAT solve to a memory-mapped solution file.
+    """
+    data = np.memmap(
+        path, dtype=np.int64, mode='w+', shape=(_HEADER_LENGTH + num_vars,)
+    )
+    data[0] = status
+    data[1] = num_vars
+    data[2:4].view(np.float64)[:] = [objective_value, best_objective_bound]
+    if len(solution) > 0:
+        data[_HEADER_LENGTH:] = solution
+    data.flush()
+
+
+class MappedSolution:
+    """
+    Solution of a CP-SAT solve read from a memory-mapped solution file
+
+    The file is written by Cpsat.solve with the solution_file option, e.g. by
+    a worker process, and is read without copying the solution.
+    """
+
+    def __init__(self, path):
+        self._data = np.memmap(path, dtype=np.int64, mode='r')
+
+    @property
+    def status(self) -> int:
+        """CP-SAT solver status"""
+        return int(self._data[0])
+
+    @property
+    def objective_value(self) -> float:
+        return float(self._data[2:4].view(np.float64)[0])
+
+    @property
+    def best_objective_bound(self) -> float:
+        return float(self._data[2:4].view(np.float64)[1])
+
+    @property
+    def solution(self):
+        """Values of the variables, in the order of the Cpsat interface"""
+        return self._data[_HEADER_LENGTH : _HEADER_LENGTH + self._data[1]]
+
+    def load_vars(
+        self, model: BlockData, vars_to_load: Optional[Sequence[VarData]] = None
+    ) -> NoReturn:
+        """
+        Load the solution into the variables of a Pyomo model.
+
+        Parameters
+        ----------
+        model: BlockData
+            The Pyomo model that was solved
+        vars_to_load: Sequence[VarData], optional
+            The variables to load. Defaults to all variables of the model.
+        """
+        if self.status not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+            raise NoFeasibleSolutionError
+
+        pyomo_vars = list(model.component_data_objects(Var, descend_into=True))
+
+        # The variables of the model come first in the solution, followed by
+        # the auxiliary CP-SAT variables of the translation, if any
+        if len(pyomo_vars) > self._data[1]:
+            raise ValueError(
+                f'The solution file has {self._data[1]} variables, but the model '
+                f'has {len(pyomo_vars)} variables.'
+            )
+
+        if vars_to_load is None:
+            values = self.solution[: len(pyomo_vars)].tolist()
+        else:
+            var_index = {id(v): i for i, v in enumerate(pyomo_vars)}
+            pyomo_vars = list(vars_to_load)
+            values = self.solution[[var_index[id(v)] for v in pyomo_vars]].tolist()
+
+        for v, val in zip(pyomo_vars, values):
+            v.set_value(val, skip_validation=True)
+
+        StaleFlagManager.mark_all_as_stale(delayed=True)
@@ -0,0 +1,373 @@
+import math
+
+from typing import Optional
+
+from pyomo.common.config import (
+    document_kwargs_from_configdict,
+    ConfigValue,
+    Bool,
+    PositiveInt,
+)
+from pyomo.common.dependencies import numpy as np
+from pyomo.core.base.block import BlockData
+from pyomo.core.kernel.objective import minimize
+from pyomo.contrib.solver.common.results import Results
+
+from .cpsat import (
+    Cpsat,
+    CpsatConfig,
+    IncompatibleModelError,
+    cp_model,
+    _clear_field,
+    _copy_proto,
+    _set_repeated,
+)
+
+
+class ParetoFrontConfig(CpsatConfig):
+    """ """
+
+    def __init__(
+        self,
+        description=None,
+        doc=None,
+        implicit=False,
+        implicit_domain=None,
+        visibility=0,
+    ):
+        super().__init__(
+            description=description,
+            doc=doc,
+            implicit=implicit,
+            implicit_domain=implicit_domain,
+            visibility=visibility,
+        )
+
+        # The loaded point is only optimal subject to its epsilon level
+        self.get('raise_exception_on_nonoptimal_result').set_default_value(False)
+
+        self.secondary_objective = self.declare(
+            'secondary_objective',
+            ConfigValue(
+                default=None,
+                description='Pyomo objective (usually deactivated) that is bounded '
+                'by the epsilon levels, in the direction of its sense, while the '
+                'active objective of the model is optimized. Required.',
+            ),
+        )
+
+        self.epsilon_levels: Optional[list] = self.declare(
+            'epsilon_levels',
+            ConfigValue(
+                domain=list,
+                default=None,
+                description='Bounds on the secondary objective, one per point of '
+                'the front. Defaults to num_points levels evenly spaced between the '
+                'value of the secondary objective at the optimum of the active '
+                'objective and the optimal value of the secondary objective, found '
+                'by two initial solves.',
+            ),
+        )
+
+        self.num_points: int = self.declare(
+            'num_points',
+            ConfigValue(
+                domain=PositiveInt,
+                default=5,
+                description='Number of points of the front when epsilon_levels is '
+                'not given.',
+            ),
+        )
+
+        self.pareto_workers: int = self.declare(
+            'pareto_workers',
+            ConfigValue(
+                domain=PositiveInt,
+                default=1,
+                description='Number of points solved in parallel. With 1, each point '
+                'is solved on the CP-SAT model of the translation; otherwise, each '
+                'point is solved on a copy. The threads (num_workers) of CP-SAT are '
+                'shared between the points solved in parallel.',
+            ),
+        )
+
+        self.pareto_solutions: bool = self.declare(
+            'pareto_solutions',
+            ConfigValue(
+                domain=Bool,
+                default=False,
+                description='If True, the solution of each point is stored in '
+                "extra_info.pareto_front['solutions'], as a row of values of the "
+                'variables in the order of the model.',
+            ),
+        )
+
+
+class ParetoFront(Cpsat):
+    """
+    Epsilon-constraint driver for CP-SAT enumerating the Pareto front of two
+    objectives
+
+    The model is translated to CP-SAT once, with the active objective of the
+    model as CP-SAT objective and a row bounding the secondary objective. For
+    each epsilon level, from the loosest to the tightest, the domain of the row
+    is set to the level and the model is solved, with the solution of the
+    neighboring (looser) point passed to CP-SAT as a hint. The time_limit and
+    other CP-SAT options apply to each point.
+    """
+
+    CONFIG = ParetoFrontConfig()
+
+    @document_kwargs_from_configdict(CONFIG)
+    def solve(self, model: BlockData, **kwargs) -> Results:
+        """
+        Solve a Pyomo model with CP-SAT for a range of bounds on a secondary
+        objective.
+
+        Parameters
+        ----------
+        model: BlockData
+            The Pyomo model to be solved
+        **kwargs
+            Additional keyword arguments (including solver_options - passthrough
+            options; delivered directly to the solver (with no validation))
+
+        Returns
+        -------
+        results: :class:`Results<pyomo.contrib.solver.common.results.Results>`
+            A results object for the point with the loosest epsilon level. The
+            front is in extra_info.pareto_front, a dict of arrays with one entry
+            per point: 'epsilon' (the levels), 'status' (the CP-SAT statuses),
+            'objective' and 'secondary_objective' (the objective values, or NaN
+            for points without a solution) and, with pareto_solutions,
+            'solutions'.
+        """
+        return super().solve(model, **kwargs)
+
+    def _optimize_model(self):
+        secondary = self._config.secondary_objective
+
+        if secondary is None:
+            raise ValueError('No secondary_objective given for the Pareto front.')
+
+        if (
+            self._config.find_infeasible_subsystem
+            or self._config.lexicographic_objectives is not None
+            or self._config.decomposition is not None
+        ):
+            raise ValueError(
+                'The Pareto front driver cannot be combined with '
+                'find_infeasible_subsystem, lexicographic_objectives or '
+                'decomposition.'
+            )
+
+        timer = self._config.timer
+
+        secondary_vars, secondary_coefs, secondary_constant = self._compile_secondary(
+            secondary
+        )
+
+        levels = self._config.epsilon_levels
+
+        if levels is not None and len(levels) == 0:
+            raise ValueError('No epsilon_levels given for the Pareto front.')
+
+        if levels is None:
+            timer.start('set_objective')
+            self._set_objective(secondary)
+            timer.stop('set_objective')
+
+            self._optimize()
+
+            if self._solver_status not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+                return {'pareto_front': self._front_arrays([], [], [])}
+
+            best_level = self._solver_response.objective_value
+
+        timer.start('set_objective')
+        self._set_objective()
+        timer.stop('set_objective')
+
+        if levels is None:
+            self._optimize()
+
+            if self._solver_status not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+                return {'pareto_front': self._front_arrays([], [], [])}
+
+            worst_level = self._secondary_value(
+                self._solver_response.solution,
+                secondary_vars,
+                secondary_coefs,
+                secondary_constant,
+            )
+            levels = np.linspace(worst_level, best_level, self._config.num_points)
+            # The solution of a response does not keep the response alive
+            hint = list(self._solver_response.solution)
+        else:
+            hint = None
+
+        # Levels from the loosest to the tightest; each level is rounded to an
+        # integer bound on the secondary objective
+        if secondary.sense == minimize:
+            levels = sorted(set(math.floor(level) for level in levels), reverse=True)
+        else:
+            levels = sorted(set(math.ceil(level) for level in levels))
+
+        proto = self._solver_model.proto
+
+        epsilon_row = proto.constraints.add()
+        epsilon_row.name = f'{secondary.name}_epsilon'
+        epsilon_row.linear.vars.extend(secondary_vars)
+        epsilon_row.linear.coeffs.extend(secondary_coefs)
+        epsilon_row.linear.domain.extend([cp_model.INT_MIN, cp_model.INT_MAX])
+
+        responses = []
+        batch_size = self._config.pareto_workers
+
+        for k in range(0, len(levels), batch_size):
+            batch = levels[k : k + batch_size]
+
+            timer.start('set_epsilon')
+            if len(batch) == 1:
+                self._set_epsilon(
+                    proto, epsilon_row, batch[0] - secondary_constant, secondary, hint
+                )
+                batch_protos = None
+            else:
+                batch_protos = []
+                for level in batch:
+                    self._set_epsilon(
+                        proto, epsilon_row, level - secondary_constant, secondary, hint
+                    )
+                    batch_proto = type(proto)()
+                    _copy_proto(batch_proto, proto)
+                    batch_protos.append(batch_proto)
+            timer.stop('set_epsilon')
+
+            if batch_protos is None:
+                self._optimize()
+                batch_responses = [self._solver_response]
+            else:
+                batch_responses = self._optimize_protos(
+                    batch_protos, self._workers_per_model(len(batch_protos))
+                )
+
+            responses.extend(batch_responses)
+
+            # The remaining points are skipped
+            if self._cancelled():
+                break
+
+            # Warm-start the next points from the tightest point of this batch
+            # with a solution
+            for response in reversed(batch_responses):
+                if response.status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+                    hint = list(response.solution)
+                    break
+
+        _set_repeated(epsilon_row.linear.domain, [cp_model.INT_MIN, cp_model.INT_MAX])
+        _clear_field(proto, 'solution_hint')
+
+        # The point with the loosest level is loaded
+        self._solver_response = type(responses[0])()
+        _copy_proto(self._solver_response, responses[0])
+        self._solver_status = responses[0].status
+
+        if self._solver_status == cp_model.OPTIMAL:
+            self._solver_status = cp_model.FEASIBLE
+
+        secondary_values = [
+            (
+                self._secondary_value(
+                    response.solution,
+                    secondary_vars,
+                    secondary_coefs,
+                    secondary_constant,
+                )
+                if response.status in [cp_model.OPTIMAL, cp_model.FEASIBLE]
+                else math.nan
+            )
+            for response in responses
+        ]
+
+        return {'pareto_front': self._front_arrays(levels, responses, secondary_values)}
+
+    def _compile_secondary(self, secondary):
+        """
+        Return the CP-SAT variable indices, integer coefficients and constant of
+        the secondary objective.
+        """
+        repn = self._repn_visitor.walk_expression(secondary.expr)
+
+        if repn.nonlinear is not None:
+            raise IncompatibleModelError(
+                f'Objective {secondary.name} contains a nonlinear expression. '
+                'CP-SAT cannot solve models with a nonlinear objective.'
+            )
+
+        if not all(float(coef).is_integer() for coef in repn.linear.values()):
+            raise IncompatibleModelError(
+                f'Objective {secondary.name} contains a fractional coefficient. '
+                'CP-SAT cannot bound secondary objectives with fractional '
+                'coefficients.'
+            )
+
+        secondary_vars = [self._pyomo_var_to_solver_index[v_id] for v_id in repn.linear]
+        secondary_coefs = [int(coef) for coef in repn.linear.values()]
+
+        return secondary_vars, secondary_coefs, repn.constant
+
+    def _secondary_value(self, solution, secondary_vars, secondary_coefs, constant):
+        return (
+            sum(coef * solution[i] for i, coef in zip(secondary_vars, secondary_coefs))
+            + constant
+        )
+
+    def _set_epsilon(self, proto, epsilon_row, bound, secondary, hint):
+        """
+        Bound the secondary objective by an epsilon level (without its
+        constant), and hint a solution.
+        """
+        if secondary.sense == minimize:
+            domain = [cp_model.INT_MIN, math.floor(bound)]
+        else:
+            domain = [math.ceil(bound), cp_model.INT_MAX]
+
+        _set_repeated(epsilon_row.linear.domain, domain)
+        _clear_field(proto, 'solution_hint')
+
+        if hint is not None:
+            num_vars = len(self._vars)
+            proto.solution_hint.vars.extend(range(num_vars))
+            proto.solution_hint.values.extend(list(hint)[:num_vars])
+
+    def _front_arrays(self, levels, responses, secondary_values):
+        has_solution = [
+            response.status in [cp_model.OPTIMAL, cp_model.FEASIBLE]
+            for response in responses
+        ]
+
+        front = {
+            'epsilon': np.array(levels, dtype=np.float64),
+            'status': np.array([r.status for r in responses], dtype=np.int64),
+            'objective': np.array(
+                [
+                    r.objective_value if ok else math.nan
+                    for r, ok in zip(responses, has_solution)
+                ],
+                dtype=np.float64,
+            ),
+            'secondary_objective': np.array(secondary_values, dtype=np.float64),
+        }
+
+        if self._config.pareto_solutions:
+            num_vars = len(self._vars)
+            solutions = np.zeros((len(responses), num_vars), dtype=np.int64)
+
+            for k, (r, ok) in enumerate(zip(responses, has_solution)):
+                if ok:
+                    solutions[k] = list(r.solution)[:num_vars]
+
+            front['solutions'] = solutions
+
+        return front
@@ -0,0 +1,264 @@
+from typing import Optional
+
+from pyomo.common.config import (
+    document_kwargs_from_configdict,
+    ConfigValue,
+    PositiveInt,
+)
+from pyomo.core.base.block import BlockData
+from pyomo.contrib.solver.common.results import Results
+
+from .cpsat import (
+    Cpsat,
+    CpsatConfig,
+    cp_model,
+    _has_field,
+    _proto_constraint_vars,
+    _set_repeated,
+)
+
+
+class RollingHorizonConfig(CpsatConfig):
+    """ """
+
+    def __init__(
+        self,
+        description=None,
+        doc=None,
+        implicit=False,
+        implicit_domain=None,
+        visibility=0,
+    ):
+        super().__init__(
+            description=description,
+            doc=doc,
+            implicit=implicit,
+            implicit_domain=implicit_domain,
+            visibility=visibility,
+        )
+
+        # A rolling-horizon solution is not proven optimal for the full model
+        self.get('raise_exception_on_nonoptimal_result').set_default_value(False)
+
+        self.time_set: Optional[list] = self.declare(
+            'time_set',
+            ConfigValue(
+                domain=list,
+                default=None,
+                description='Ordered time periods of the model (e.g. a Pyomo Set). '
+                'Required.',
+            ),
+        )
+
+        self.time_position: int = self.declare(
+            'time_position',
+            ConfigValue(
+                domain=int,
+                default=-1,
+                description='Position of the time period in the index of '
+                'time-indexed variables.',
+            ),
+        )
+
+        self.time_indexed_vars: Optional[list] = self.declare(
+            'time_indexed_vars',
+            ConfigValue(
+                domain=list,
+                default=None,
+                description='Var components that are indexed by time. Defaults to '
+                'all variables whose index contains a time period at time_position. '
+                'Other variables are never fixed by the driver.',
+            ),
+        )
+
+        self.window_size: int = self.declare(
+            'window_size',
+            ConfigValue(
+                domain=PositiveInt,
+                default=1,
+                description='Number of time periods optimized in each window.',
+            ),
+        )
+
+        self.window_step: Optional[int] = self.declare(
+            'window_step',
+            ConfigValue(
+                domain=PositiveInt,
+                default=None,
+                description='Number of time periods fixed after each window, and by '
+                'which the window moves forward. Defaults to window_size; smaller '
+                'values give overlapping windows.',
+            ),
+        )
+
+
+class RollingHorizon(Cpsat):
+    """
+    Rolling-horizon (relax-and-fix) driver for CP-SAT
+
+    The model is translated to CP-SAT once. Each window is then solved on the
+    same CP-SAT model: constraints involving time periods after the window are
+    relaxed (temporarily made redundant), time periods before the window are
+    fixed to the values found in earlier windows by tightening their domains in
+    place, and the previous solution is passed to CP-SAT as a hint. The
+    time_limit and other CP-SAT options apply to each window.
+    """
+
+    CONFIG = RollingHorizonConfig()
+
+    @document_kwargs_from_configdict(CONFIG)
+    def solve(self, model: BlockData, **kwargs) -> Results:
+        """
+        Solve a time-indexed Pyomo model with CP-SAT, window by window.
+
+        Parameters
+        ----------
+        model: BlockData
+            The Pyomo model to be solved
+        **kwargs
+            Additional keyword arguments (including solver_options - passthrough
+            options; delivered directly to the solver (with no validation))
+
+        Returns
+        -------
+        results: :class:`Results<pyomo.contrib.solver.common.results.Results>`
+            A results object. The objective values of the windows are in
+            extra_info.window_objective_values.
+        """
+        return super().solve(model, **kwargs)
+
+    def _optimize_model(self):
+        if self._config.time_set is None:
+            raise ValueError('No time_set given for the rolling-horizon driver.')
+
+        if (
+            self._config.find_infeasible_subsystem
+            or self._config.lexicographic_objectives is not None
+            or self._config.decomposition is not None
+        ):
+            raise ValueError(
+                'The rolling-horizon driver cannot be combined with '
+                'find_infeasible_subsystem, lexicographic_objectives or '
+                'decomposition.'
+            )
+
+        timer = self._config.timer
+
+        timer.start('set_objective')
+        self._set_objective()
+        timer.stop('set_objective')
+
+        num_periods = len(self._config.time_set)
+        window_size = self._config.window_size
+        window_step = self._config.window_step or window_size
+
+        proto = self._solver_model.proto
+
+        # Auxiliary CP-SAT variables (e.g. of symmetry-breaking constraints) are
+        # not indexed by time
+        var_periods = self._var_periods()
+        var_periods += [None] * (len(proto.variables) - len(var_periods))
+
+        vars_by_period = [[] for _ in range(num_periods)]
+        for i, period in enumerate(var_periods):
+            if period is not None:
+                vars_by_period[period].append(i)
+
+        # Each constraint is relaxed until the window reaches the last time
+        # period of its variables
+        relaxed_cons = []
+        for j, con in enumerate(proto.constraints):
+            periods = [
+                var_periods[ref if ref >= 0 else -ref - 1]
+                for ref in _proto_constraint_vars(con)
+            ]
+            last_period = max((p for p in periods if p is not None), default=-1)
+
+            if last_period >= window_size and _has_field(con, 'linear'):
+                relaxed_cons.append((last_period, j, list(con.linear.domain)))
+                _set_repeated(con.linear.domain, [cp_model.INT_MIN, cp_model.INT_MAX])
+
+        relaxed_cons.sort(reverse=True)
+
+        window_objective_values = []
+        start = 0
+
+        while True:
+            end = min(start + window_size, num_periods)
+
+            timer.start('restore_constraints')
+            while relaxed_cons and relaxed_cons[-1][0] < end:
+                _, j, domain = relaxed_cons.pop()
+                _set_repeated(proto.constraints[j].linear.domain, domain)
+            timer.stop('restore_constraints')
+
+            self._optimize()
+
+            if self._solver_status not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+                # Infeasibility of a later window is caused by the fixed periods
+                if start > 0 and self._solver_status == cp_model.INFEASIBLE:
+                    self._solver_status = cp_model.UNKNOWN
+                break
+
+            window_objective_values.append(self._solver_response.objective_value)
+
+            if end == num_periods:
+                break
+
+            # The solution of an unfinished horizon is not feasible
+            if self._cancelled():
+                self._solver_status = cp_model.UNKNOWN
+                break
+
+            timer.start('fix_window')
+            for period in range(start, min(start + window_step, num_periods)):
+                for i in vars_by_period[period]:
+                    val = self._solver_response.solution[i]
+                    _set_repeated(proto.variables[i].domain, [val, val])
+
+            self._add_solution_hint()
+            timer.stop('fix_window')
+
+            start += window_step
+
+        # The last window is only optimal for the periods it did not fix
+        if self._solver_status == cp_model.OPTIMAL and len(window_objective_values) > 1:
+            self._solver_status = cp_model.FEASIBLE
+
+        return {'window_objective_values': window_objective_values}
+
+    def _var_periods(self):
+        """
+        Return the position in time_set of the time period of each variable,
+        or None for variables that are not indexed by time.
+        """
+        period_of_time = {t: k for k, t in enumerate(self._config.time_set)}
+        position = self._config.time_position
+
+        if self._config.time_indexed_vars is None:
+            time_indexed_ids = None
+        else:
+            time_indexed_ids = set(
+                id(v) for var in self._config.time_indexed_vars for v in var.values()
+            )
+
+        var_periods = []
+
+        for v in self._vars:
+            index = v.index()
+
+            if index is None or (
+                time_indexed_ids is not None and id(v) not in time_indexed_ids
+            ):
+                var_periods.append(None)
+                continue
+
+            if not isinstance(index, tuple):
+                index = (index,)
+
+            try:
+                var_periods.append(period_of_time.get(index[position], None))
+            except IndexError:
+                var_periods.append(None)
+
+        return var_periods
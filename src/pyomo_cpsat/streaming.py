@@ -0,0 +1,387 @@
+import math
+
+from typing import Any, Hashable, Iterable, Optional, Sequence, Tuple, NoReturn
+
+from pyomo.common.config import document_kwargs_from_configdict
+from pyomo.common.dependencies import numpy as np
+from pyomo.contrib.solver.common.results import Results
+from pyomo.contrib.solver.common.solution_loader import SolutionLoaderBase
+
+from .cpsat import (
+    Cpsat,
+    IncompatibleModelError,
+    cp_model,
+    _clear_field,
+    _has_field,
+)
+
+
+def _var_bound_array(bound, n, name):
+    """
+    Return the bounds of a group of n variables as a list of integers.
+    """
+    arr = np.broadcast_to(np.asarray(bound), (n,))
+
+    if arr.dtype.kind not in 'iub':
+        arr = arr.astype(np.float64)
+
+        if not np.all(np.isfinite(arr)):
+            raise IncompatibleModelError(
+                f'Variables {name} have infinite or missing bounds. '
+                'CP-SAT cannot solve models with unbounded variables.'
+            )
+
+        if not np.all(arr == np.floor(arr)):
+            raise IncompatibleModelError(
+                f'Variables {name} have fractional bounds. '
+                'CP-SAT cannot solve models with fractional variable bounds.'
+            )
+
+        if n > 0 and not (
+            arr.min() > cp_model.INT_MIN and arr.max() < cp_model.INT_MAX
+        ):
+            raise IncompatibleModelError(
+                f'Variables {name} have bounds outside the 64-bit integer range '
+                'supported by CP-SAT.'
+            )
+
+    return arr.astype(np.int64).tolist()
+
+
+def _row_bound_array(bound, n, lower):
+    """
+    Return the lower or upper bounds of n rows as a list of integers. Missing
+    and infinite bounds are replaced with the limits of CP-SAT, and fractional
+    bounds are rounded inwards, since the row activities are integral.
+    """
+    default = cp_model.INT_MIN if lower else cp_model.INT_MAX
+
+    if bound is None:
+        return [default] * n
+
+    arr = np.broadcast_to(np.asarray(bound), (n,))
+
+    if arr.dtype.kind in 'iub':
+        return arr.astype(np.int64).tolist()
+
+    arr = np.ceil(arr) if lower else np.floor(arr)
+    in_range = (arr > cp_model.INT_MIN) & (arr < cp_model.INT_MAX)
+
+    result = np.full(n, default, dtype=np.int64)
+    result[in_range] = arr[in_range].astype(np.int64)
+
+    return result.tolist()
+
+
+def _row_bound(bound, lower):
+    """
+    Return the lower or upper bound of a single row as an integer.
+    """
+    if bound is None or math.isinf(bound):
+        return cp_model.INT_MIN if lower else cp_model.INT_MAX
+
+    bound = math.ceil(bound) if lower else math.floor(bound)
+
+    return min(max(bound, cp_model.INT_MIN), cp_model.INT_MAX)
+
+
+def _integer_coefs(coefs, name):
+    """
+    Return coefficients as a list of integers.
+    """
+    arr = np.asarray(coefs)
+
+    if arr.dtype.kind not in 'iub':
+        arr = arr.astype(np.float64)
+
+        # Infinite values equal their rounded values, and are cast to garbage
+        if not np.all(np.isfinite(arr) & (arr == np.round(arr))):
+            raise IncompatibleModelError(
+                f'{name} contain fractional or infinite coefficients. '
+                'CP-SAT cannot solve models with fractional coefficients.'
+            )
+
+    return arr.astype(np.int64).tolist()
+
+
+class StreamingModel:
+    """
+    CP-SAT model built directly from streams of variables and linear rows
+
+    Integer variables are added in named groups with index tuples, like the
+    indexed Var components of a Pyomo model, and are numbered consecutively in
+    the order they are added. Rows and the objective refer to the variables by
+    these positions, e.g. as the column indices of CSR chunks. Variables and
+    rows are written straight into the CP-SAT model proto, without building
+    Pyomo components; solutions are mapped back to the names and index tuples
+    of the variables.
+    """
+
+    def __init__(self):
+        self.cp_model = cp_model.CpModel()
+
+        # Name of each group of variables: position of its first variable and
+        # its index tuples
+        self._var_groups = {}
+        self._var_positions = {}
+
+        # Solution loaded by StreamingCpsat, in the order of the positions
+        self.solution = None
+
+    @property
+    def num_vars(self) -> int:
+        return len(self.cp_model.proto.variables)
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.cp_model.proto.constraints)
+
+    def add_vars(
+        self,
+        name: str,
+        indices: Optional[Iterable[Hashable]],
+        lb,
+        ub,
+    ) -> int:
+        """
+        Add a group of integer variables.
+
+        Parameters
+        ----------
+        name: str
+            The name of the group of variables
+        indices: Iterable[Hashable], optional
+            The index tuples of the variables. If None, a single variable with
+            index None is added.
+        lb, ub
+            The bounds of the variables, as scalars or arrays with one bound per
+            variable
+
+        Returns
+        -------
+        start: int
+            The position of the first variable of the group
+        """
+        if name in self._var_groups:
+            raise ValueError(f'Variables {name} have already been added.')
+
+        indices = [None] if indices is None else list(indices)
+        n = len(indices)
+
+        lbs = _var_bound_array(lb, n, name)
+        ubs = _var_bound_array(ub, n, name)
+
+        proto = self.cp_model.proto
+        start = len(proto.variables)
+
+        for var_lb, var_ub in zip(lbs, ubs):
+            proto.variables.add().domain.extend((var_lb, var_ub))
+
+        self._var_groups[name] = (start, indices)
+
+        return start
+
+    def position(self, name: str, index: Hashable = None) -> int:
+        """
+        Return the position of a variable, given its name and index tuple.
+        """
+        positions = self._var_positions.get(name, None)
+
+        if positions is None:
+            start, indices = self._var_groups[name]
+            positions = {idx: start + k for k, idx in enumerate(indices)}
+            self._var_positions[name] = positions
+
+        return positions[index]
+
+    def add_rows(
+        self, rows: Iterable[Tuple[Sequence[int], Sequence[Any], Any, Any]]
+    ) -> NoReturn:
+        """
+        Add linear rows lb <= sum(coefs[k] * x[positions[k]]) <= ub.
+
+        Parameters
+        ----------
+        rows: Iterable[Tuple[Sequence[int], Sequence[Any], Any, Any]]
+            The rows, e.g. from a generator, as tuples (positions, coefs, lb,
+            ub) with integral coefficients. Missing bounds are given as None.
+        """
+        proto = self.cp_model.proto
+        num_vars = self.num_vars
+
+        for positions, coefs, lb, ub in rows:
+            if len(positions) > 0 and (
+                min(positions) < 0 or max(positions) >= num_vars
+            ):
+                raise ValueError('Rows refer to variables that have not been added.')
+
+            linear = proto.constraints.add().linear
+            linear.vars.extend(positions)
+            linear.coeffs.extend(_integer_coefs(coefs, 'Rows'))
+            linear.domain.extend((_row_bound(lb, True), _row_bound(ub, False)))
+
+    def add_csr_rows(self, indptr, indices, data, lb=None, ub=None) -> NoReturn:
+        """
+        Add a chunk of linear rows lb <= A x <= ub, with A in compressed sparse
+        row (CSR) format, e.g. the indptr, indices and data arrays of a
+        scipy.sparse.csr_matrix.
+
+        Parameters
+        ----------
+        indptr, indices, data
+            The CSR arrays of A: the columns are the positions of the variables
+            and the coefficients must be integral
+        lb, ub
+            The bounds of the rows, as scalars or arrays with one bound per row.
+            Missing bounds are given as None or infinite values.
+        """
+        indptr = np.asarray(indptr, dtype=np.int64)
+        cols = np.asarray(indices, dtype=np.int64)
+        n = len(indptr) - 1
+
+        if len(cols) > 0 and (cols.min() < 0 or cols.max() >= self.num_vars):
+            raise ValueError('CSR rows refer to variables that have not been added.')
+
+        coefs = _integer_coefs(data, 'CSR rows')
+        cols = cols.tolist()
+        lbs = _row_bound_array(lb, n, True)
+        ubs = _row_bound_array(ub, n, False)
+
+        proto = self.cp_model.proto
+        ptr = indptr.tolist()
+
+        for k in range(n):
+            start, end = ptr[k], ptr[k + 1]
+            linear = proto.constraints.add().linear
+            linear.vars.extend(cols[start:end])
+            linear.coeffs.extend(coefs[start:end])
+            linear.domain.extend((lbs[k], ubs[k]))
+
+    def minimize(self, positions: Sequence[int], coefs, offset=0) -> NoReturn:
+        """
+        Set the objective to minimize sum(coefs[k] * x[positions[k]]) + offset.
+        """
+        self._set_objective(positions, coefs, offset, 1)
+
+    def maximize(self, positions: Sequence[int], coefs, offset=0) -> NoReturn:
+        """
+        Set the objective to maximize sum(coefs[k] * x[positions[k]]) + offset.
+        """
+        self._set_objective(positions, coefs, offset, -1)
+
+    def _set_objective(self, positions, coefs, offset, sign):
+        proto = self.cp_model.proto
+        _clear_field(proto, 'objective')
+
+        # CP-SAT minimizes; maximization objectives are negated and scaled back
+        # by a scaling factor of -1
+        objective = proto.objective
+        objective.vars.extend(positions)
+        objective.coeffs.extend(
+            [sign * coef for coef in _integer_coefs(coefs, 'The objective')]
+        )
+        objective.offset = sign * offset
+        objective.scaling_factor = sign
+
+    def values(self, name: str) -> dict:
+        """
+        Return the values of a group of variables in the loaded solution, as a
+        dict from index tuples to values.
+        """
+        if self.solution is None:
+            raise ValueError('No solution has been loaded.')
+
+        start, indices = self._var_groups[name]
+        values = self.solution[start : start + len(indices)].tolist()
+
+        return dict(zip(indices, values))
+
+    def value(self, name: str, index: Hashable = None) -> int:
+        """
+        Return the value of a variable in the loaded solution.
+        """
+        if self.solution is None:
+            raise ValueError('No solution has been loaded.')
+
+        return int(self.solution[self.position(name, index)])
+
+
+class StreamingSolutionLoader(SolutionLoaderBase):
+    """
+    Solution loader for CP-SAT models built with StreamingModel
+    """
+
+    def __init__(self, cpsat_solution: Sequence[int], streaming_model: StreamingModel):
+        # The solution of a CP-SAT response is a view that does not keep the
+        # response alive, so the values are copied
+        self.cpsat_solution = list(cpsat_solution)
+        self.streaming_model = streaming_model
+
+    def load_vars(self, vars_to_load=None) -> NoReturn:
+        if vars_to_load is not None:
+            raise ValueError(
+                'The solution of a StreamingModel is loaded for all variables.'
+            )
+
+        self.streaming_model.solution = np.array(self.cpsat_solution, dtype=np.int64)
+
+
+class StreamingCpsat(Cpsat):
+    """
+    CP-SAT solver interface for models built with StreamingModel
+
+    The CP-SAT model of the StreamingModel is solved as is, with the options of
+    Cpsat; the solution is loaded into the StreamingModel.
+    """
+
+    @document_kwargs_from_configdict(Cpsat.CONFIG)
+    def solve(self, model: StreamingModel, **kwargs) -> Results:
+        """
+        Solve a StreamingModel with CP-SAT.
+
+        Parameters
+        ----------
+        model: StreamingModel
+            The model to be solved
+        **kwargs
+            Additional keyword arguments (including solver_options - passthrough
+            options; delivered directly to the solver (with no validation))
+
+        Returns
+        -------
+        results: :class:`Results<pyomo.contrib.solver.common.results.Results>`
+            A results object. With load_solutions, the solution is loaded into
+            the StreamingModel, see StreamingModel.values.
+        """
+        return super().solve(model, **kwargs)
+
+    def _translate_model(self):
+        if (
+            self._config.find_infeasible_subsystem
+            or self._config.lexicographic_objectives is not None
+            or self._config.decomposition == 'blocks'
+            or self._config.strict_integer
+            or self._config.reduce_rows
+            or self._config.symmetric_index_sets is not None
+            or self._config.circuits is not None
+            or self._config.scale_objective
+            or self._config.objective_precision is not None
+        ):
+            raise ValueError(
+                'A StreamingModel cannot be solved with find_infeasible_subsystem, '
+                "lexicographic_objectives, decomposition='blocks', strict_integer, "
+                'reduce_rows, symmetric_index_sets, circuits, scale_objective or '
+                'objective_precision.'
+            )
+
+        self._model.solution = None
+        self._solver_model = self._model.cp_model
+
+    def _set_objective(self, obj=None):
+        if not _has_field(self._solver_model.proto, 'objective'):
+            raise ValueError('No objective set in the StreamingModel.')
+
+        self._objective = None
+
+    def _solution_loader(self):
+        return StreamingSolutionLoader(self._solver_response.solution, self._model)
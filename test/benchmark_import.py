@@ -0,0 +1,38 @@
+"""
+Measure the time to import pyomo_cpsat in a fresh interpreter, with and without
+first creating and solving a model with Cpsat
+"""
+
+import statistics
+import subprocess
+import sys
+
+REPEATS = 10
+
+SNIPPETS = {
+    'import pyomo.environ': 'import pyomo.environ',
+    'import pyomo_cpsat': 'import pyomo.environ; import pyomo_cpsat',
+    'import pyomo_cpsat, Cpsat().available()': (
+        'import pyomo.environ; import pyomo_cpsat; pyomo_cpsat.Cpsat().available()'
+    ),
+}
+
+TIMER = """
+import time
+start = time.perf_counter()
+{snippet}
+print(time.perf_counter() - start)
+"""
+
+for label, snippet in SNIPPETS.items():
+    times = []
+    for _ in range(REPEATS):
+        out = subprocess.run(
+            [sys.executable, '-c', TIMER.format(snippet=snippet)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        times.append(float(out.stdout))
+
+    print(f'{label:45s} min {min(times):.3f}s  median {statistics.median(times):.3f}s')
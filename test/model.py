@@ -353,3 +353,396 @@ class ConstantObjModel:
             return 500 + 0 * model.x[1]
 
         self.model.obj = pyo.Objective(rule=obj_rule, sense=pyo.maximize)
+
+
+class LexicographicModel:
+    """
+    A model with two objectives to optimize lexicographically.
+    """
+
+    def __init__(self):
+        self.model = pyo.ConcreteModel()
+
+        self.model.I = pyo.Set(initialize=[1, 2, 3])
+        self.model.x = pyo.Var(self.model.I, domain=pyo.Integers, bounds=(0, 10))
+
+        def con_rule(model):
+            return pyo.quicksum(model.x[i] for i in model.I) <= 10
+
+        self.model.con = pyo.Constraint(rule=con_rule)
+
+        def obj1_rule(model):
+            return model.x[1] + model.x[2]
+
+        self.model.obj1 = pyo.Objective(rule=obj1_rule, sense=pyo.maximize)
+
+        def obj2_rule(model):
+            return 2 * model.x[3] - model.x[1]
+
+        self.model.obj2 = pyo.Objective(rule=obj2_rule, sense=pyo.maximize)
+        self.model.obj2.deactivate()
+
+
+class FractionalConModel:
+    """
+    A model with a fractional constraint coefficient.
+    """
+
+    def __init__(self):
+        self.model = pyo.ConcreteModel()
+
+        self.model.I = pyo.Set(initialize=[1, 2, 3])
+        self.model.w = pyo.Param(self.model.I, initialize={1: 10, 2: 20.5, 3: 30})
+        self.model.x = pyo.Var(self.model.I, domain=pyo.Integers, bounds=(0, 100))
+
+        def con_rule(model):
+            return pyo.quicksum(model.w[i] * model.x[i] for i in model.I) <= 20
+
+        self.model.con = pyo.Constraint(rule=con_rule)
+
+        def obj_rule(model):
+            return pyo.quicksum(model.x[i] for i in model.I)
+
+        self.model.obj = pyo.Objective(rule=obj_rule, sense=pyo.maximize)
+
+
+class OverflowModel:
+    """
+    A model with a constraint that may overflow 64-bit integer arithmetic.
+    """
+
+    def __init__(self):
+        self.model = pyo.ConcreteModel()
+
+        self.model.I = pyo.Set(initialize=[1, 2, 3])
+        self.model.x = pyo.Var(self.model.I, domain=pyo.Integers, bounds=(0, 2**40))
+
+        def con_rule(model):
+            return pyo.quicksum(2**30 * model.x[i] for i in model.I) <= 20
+
+        self.model.con = pyo.Constraint(rule=con_rule)
+
+        def obj_rule(model):
+            return pyo.quicksum(model.x[i] for i in model.I)
+
+        self.model.obj = pyo.Objective(rule=obj_rule, sense=pyo.maximize)
+
+
+class LargeCoefModel:
+    """
+    A model with coefficients and bounds that doubles cannot hold exactly.
+    """
+
+    def __init__(self):
+        self.model = pyo.ConcreteModel()
+
+        self.model.x = pyo.Var(domain=pyo.Integers, bounds=(0, 1))
+        self.model.y = pyo.Var(domain=pyo.Integers, bounds=(0, 1))
+        self.model.z = pyo.Var(domain=pyo.Integers, bounds=(0, 2**53 + 1))
+
+        self.model.con = pyo.Constraint(
+            expr=(2**53 + 1) * self.model.x + self.model.y <= 2**53 + 1
+        )
+
+        self.model.obj = pyo.Objective(
+            expr=self.model.x + self.model.y, sense=pyo.maximize
+        )
+
+
+class ReducibleModel:
+    """
+    A model with constant, singleton and duplicate constraints.
+    """
+
+    def __init__(self):
+        self.model = pyo.ConcreteModel()
+
+        self.model.I = pyo.Set(initialize=[1, 2, 3])
+        self.model.x = pyo.Var(self.model.I, domain=pyo.Integers, bounds=(0, 10))
+        self.model.y = pyo.Var(domain=pyo.Integers, bounds=(0, 10))
+        self.model.y.fix(5)
+
+        self.model.constant_con = pyo.Constraint(expr=self.model.y <= 10)
+        self.model.singleton_con = pyo.Constraint(expr=2 * self.model.x[1] <= 7)
+        self.model.con_1 = pyo.Constraint(expr=self.model.x[1] + self.model.x[2] <= 8)
+        self.model.con_2 = pyo.Constraint(expr=self.model.x[2] + self.model.x[1] <= 6)
+
+        def obj_rule(model):
+            return pyo.quicksum(model.x[i] for i in model.I)
+
+        self.model.obj = pyo.Objective(rule=obj_rule, sense=pyo.maximize)
+
+
+class BatchSizeModel:
+    """
+    A model with variables whose domain is a finite set of batch sizes.
+    """
+
+    def __init__(self):
+        self.model = pyo.ConcreteModel()
+
+        self.model.I = pyo.Set(initialize=[1, 2])
+        self.model.S = pyo.Set(initialize=[0, 50, 100, 200])
+        self.model.x = pyo.Var(self.model.I, domain=self.model.S)
+
+        def con_rule(model):
+            return pyo.quicksum(model.x[i] for i in model.I) <= 180
+
+        self.model.con = pyo.Constraint(rule=con_rule)
+
+        def obj_rule(model):
+            return pyo.quicksum(model.x[i] for i in model.I)
+
+        self.model.obj = pyo.Objective(rule=obj_rule, sense=pyo.maximize)
+
+
+class MultiSiteModel:
+    """
+    A model with independent sites, each modelled in its own block.
+    """
+
+    def __init__(self):
+        cake_types = ['chocolate', 'vanilla', 'matcha']
+        ingredients = ['eggs', 'flour']
+
+        prices = {'chocolate': 3, 'vanilla': 4, 'matcha': 5}
+
+        available_ingredients = {'eggs': 32, 'flour': 48}
+
+        recipes = {
+            ('eggs', 'chocolate'): 4,
+            ('eggs', 'vanilla'): 2,
+            ('eggs', 'matcha'): 3,
+            ('flour', 'chocolate'): 4,
+            ('flour', 'vanilla'): 6,
+            ('flour', 'matcha'): 5,
+        }
+
+        self.model = pyo.ConcreteModel()
+
+        self.model.S = pyo.Set(initialize=['north', 'south'])
+        self.model.K = pyo.Set(initialize=cake_types)
+        self.model.I = pyo.Set(initialize=ingredients)
+
+        def site_rule(b, s):
+            b.x = pyo.Var(self.model.K, domain=pyo.Integers, bounds=(0, 100))
+
+            def ingredients_available_rule(b, i):
+                return (
+                    pyo.quicksum(recipes[i, k] * b.x[k] for k in self.model.K)
+                    <= available_ingredients[i]
+                )
+
+            b.ingredients_available_con = pyo.Constraint(
+                self.model.I, rule=ingredients_available_rule
+            )
+
+        self.model.site = pyo.Block(self.model.S, rule=site_rule)
+
+        def obj_rule(model):
+            return pyo.quicksum(
+                prices[k] * model.site[s].x[k] for s in model.S for k in model.K
+            )
+
+        self.model.obj = pyo.Objective(rule=obj_rule, sense=pyo.maximize)
+
+
+class LotSizingModel:
+    """
+    A lot-sizing model over 4 time periods.
+    """
+
+    def __init__(self):
+        demand = {1: 3, 2: 4, 3: 6, 4: 2}
+
+        self.model = pyo.ConcreteModel()
+
+        self.model.T = pyo.Set(initialize=[1, 2, 3, 4])
+        self.model.d = pyo.Param(self.model.T, initialize=demand)
+
+        self.model.x = pyo.Var(self.model.T, domain=pyo.Integers, bounds=(0, 10))
+        self.model.s = pyo.Var(self.model.T, domain=pyo.Integers, bounds=(0, 20))
+        self.model.y = pyo.Var(self.model.T, domain=pyo.Binary)
+
+        def balance_rule(model, t):
+            previous = model.s[t - 1] if t > 1 else 0
+            return previous + model.x[t] - model.d[t] == model.s[t]
+
+        self.model.balance_con = pyo.Constraint(self.model.T, rule=balance_rule)
+
+        def setup_rule(model, t):
+            return model.x[t] <= 10 * model.y[t]
+
+        self.model.setup_con = pyo.Constraint(self.model.T, rule=setup_rule)
+
+        def obj_rule(model):
+            return pyo.quicksum(8 * model.y[t] + model.s[t] for t in model.T)
+
+        self.model.obj = pyo.Objective(rule=obj_rule, sense=pyo.minimize)
+
+
+class BinPackingModel:
+    """
+    A bin packing model with 6 items and 4 identical bins.
+    """
+
+    def __init__(self):
+        sizes = {1: 4, 2: 8, 3: 1, 4: 4, 5: 2, 6: 1}
+        capacity = 10
+
+        self.model = pyo.ConcreteModel()
+
+        self.model.J = pyo.Set(initialize=sizes.keys())
+        self.model.K = pyo.Set(initialize=[1, 2, 3, 4])
+        self.model.w = pyo.Param(self.model.J, initialize=sizes)
+
+        self.model.x = pyo.Var(self.model.J, self.model.K, domain=pyo.Binary)
+        self.model.y = pyo.Var(self.model.K, domain=pyo.Binary)
+
+        def assign_rule(model, j):
+            return pyo.quicksum(model.x[j, k] for k in model.K) == 1
+
+        self.model.assign_con = pyo.Constraint(self.model.J, rule=assign_rule)
+
+        def capacity_rule(model, k):
+            return (
+                pyo.quicksum(model.w[j] * model.x[j, k] for j in model.J)
+                <= capacity * model.y[k]
+            )
+
+        self.model.capacity_con = pyo.Constraint(self.model.K, rule=capacity_rule)
+
+        def obj_rule(model):
+            return pyo.quicksum(model.y[k] for k in model.K)
+
+        self.model.obj = pyo.Objective(rule=obj_rule, sense=pyo.minimize)
+
+
+class ParetoModel:
+    """
+    A project selection model with a value objective and a cost objective.
+    """
+
+    def __init__(self):
+        values = {1: 10, 2: 7, 3: 5, 4: 3}
+        costs = {1: 8, 2: 5, 3: 3, 4: 1}
+
+        self.model = pyo.ConcreteModel()
+
+        self.model.I = pyo.Set(initialize=[1, 2, 3, 4])
+        self.model.v = pyo.Param(self.model.I, initialize=values)
+        self.model.c = pyo.Param(self.model.I, initialize=costs)
+
+        self.model.x = pyo.Var(self.model.I, domain=pyo.Binary)
+
+        def value_rule(model):
+            return pyo.quicksum(model.v[i] * model.x[i] for i in model.I)
+
+        self.model.value_obj = pyo.Objective(rule=value_rule, sense=pyo.maximize)
+
+        def cost_rule(model):
+            return 2 + pyo.quicksum(model.c[i] * model.x[i] for i in model.I)
+
+        self.model.cost_obj = pyo.Objective(rule=cost_rule, sense=pyo.minimize)
+        self.model.cost_obj.deactivate()
+
+
+class MultiKnapsackModel:
+    """
+    A multi-dimensional knapsack model that CP-SAT does not solve to optimality
+    quickly.
+    """
+
+    def __init__(self, num_items=300, num_dims=150):
+        self.model = pyo.ConcreteModel()
+
+        self.model.I = pyo.RangeSet(num_items)
+        self.model.D = pyo.RangeSet(num_dims)
+
+        self.model.x = pyo.Var(self.model.I, domain=pyo.Integers, bounds=(0, 20))
+
+        def capacity_rule(model, d):
+            return (
+                pyo.quicksum(
+                    ((7 * i + 13 * d * i) % 29 + 1) * model.x[i] for i in model.I
+                )
+                <= 500 + (37 * d) % 1500
+            )
+
+        self.model.capacity_con = pyo.Constraint(self.model.D, rule=capacity_rule)
+
+        def obj_rule(model):
+            return pyo.quicksum(((11 * i) % 39 + 1) * model.x[i] for i in model.I)
+
+        self.model.obj = pyo.Objective(rule=obj_rule, sense=pyo.maximize)
+
+
+class TravelingSalesmanModel:
+    """
+    A traveling salesman model with Miller-Tucker-Zemlin subtour elimination
+    constraints.
+    """
+
+    def __init__(self):
+        coords = {1: (0, 0), 2: (4, 0), 3: (4, 3), 4: (0, 3), 5: (2, 6), 6: (6, 6)}
+
+        self.model = pyo.ConcreteModel()
+
+        self.model.N = pyo.Set(initialize=list(coords))
+        self.model.A = pyo.Set(
+            initialize=[(i, j) for i in coords for j in coords if i != j]
+        )
+
+        def dist_init(model, i, j):
+            return abs(coords[i][0] - coords[j][0]) + abs(coords[i][1] - coords[j][1])
+
+        self.model.d = pyo.Param(self.model.A, initialize=dist_init)
+
+        self.model.x = pyo.Var(self.model.A, domain=pyo.Binary)
+        self.model.u = pyo.Var(self.model.N, domain=pyo.Integers, bounds=(1, 5))
+
+        def out_rule(model, i):
+            return pyo.quicksum(model.x[i, j] for j in model.N if j != i) == 1
+
+        self.model.out_con = pyo.Constraint(self.model.N, rule=out_rule)
+
+        def in_rule(model, j):
+            return pyo.quicksum(model.x[i, j] for i in model.N if i != j) == 1
+
+        self.model.in_con = pyo.Constraint(self.model.N, rule=in_rule)
+
+        def mtz_rule(model, i, j):
+            if i == 1 or j == 1:
+                return pyo.Constraint.Skip
+            return model.u[i] - model.u[j] + 5 * model.x[i, j] <= 4
+
+        self.model.mtz_con = pyo.Constraint(self.model.A, rule=mtz_rule)
+
+        def obj_rule(model):
+            return pyo.quicksum(model.d[i, j] * model.x[i, j] for i, j in model.A)
+
+        self.model.obj = pyo.Objective(rule=obj_rule, sense=pyo.minimize)
+
+
+class FractionalObjModel:
+    """
+    A model with fractional objective coefficients.
+    """
+
+    def __init__(self):
+        self.model = pyo.ConcreteModel()
+
+        self.model.I = pyo.Set(initialize=[1, 2, 3])
+        self.model.x = pyo.Var(self.model.I, domain=pyo.Integers, bounds=(0, 10))
+
+        self.model.con = pyo.Constraint(
+            expr=3 * self.model.x[1] + 5 * self.model.x[2] + 7 * self.model.x[3] <= 40
+        )
+
+        self.model.obj = pyo.Objective(
+            expr=0.1 * self.model.x[1]
+            + 0.35 * self.model.x[2]
+            + (1 / 3) * self.model.x[3]
+            + 0.05,
+            sense=pyo.maximize,
+        )
@@ -1,11 +1,15 @@
+import copy
+import io
 import pytest
 import pyomo.environ as pyo
+from concurrent.futures import ThreadPoolExecutor
 from pyomo.contrib.solver.common.results import SolutionStatus, TerminationCondition
 from pyomo.contrib.solver.common.util import (
     NoFeasibleSolutionError,
     NoOptimalSolutionError,
 )
 from pyomo_cpsat import Cpsat, IncompatibleModelError
+from pyomo_cpsat.cpsat import _has_field
 from model import (
     SimpleModel,
     MinObjModel,
@@ -20,9 +24,14 @@ from model import (
     InfeasibleModel,
     InactiveConModel,
     ConstantObjModel,
+    FractionalConModel,
+    OverflowModel,
+    LargeCoefModel,
+    ReducibleModel,
+    BatchSizeModel,
+    FractionalObjModel,
 )
 
-
 solver = Cpsat()
 
 
@@ -51,7 +60,80 @@ def test_solver_options_repeating():
         simple.model,
         solver_options={'subsolvers': ['pseudo_costs', 'probing']},
     )
-    assert solver._solver_solver.parameters.subsolvers == ['pseudo_costs', 'probing']
+    assert list(solver._solver_solver.parameters.subsolvers) == [
+        'pseudo_costs',
+        'probing',
+    ]
+
+
+def test_solver_reuse():
+    simple = SimpleModel()
+    solver.solve(simple.model, presolve_only=True, solver_options={'num_workers': 2})
+    cpsat_solver = solver._solver_solver
+    assert cpsat_solver.parameters.stop_after_presolve
+    solver.solve(simple.model, solver_options={'num_workers': 2})
+    assert solver._solver_solver is cpsat_solver
+    assert not cpsat_solver.parameters.stop_after_presolve
+    assert cpsat_solver.parameters.num_workers == 2
+    assert pyo.value(simple.model.obj) == 196
+    solver.solve(simple.model)
+    assert cpsat_solver.parameters.num_workers == 0
+
+
+def test_deepcopy():
+    simple = SimpleModel()
+    solver.solve(simple.model)
+    solver_copy = copy.deepcopy(solver)
+    simple = SimpleModel()
+    solver_copy.solve(simple.model)
+    assert pyo.value(simple.model.obj) == 196
+
+
+def test_load_solution_after_next_solve():
+    simple = SimpleModel()
+    results = solver.solve(simple.model, load_solutions=False)
+    maxobj = MaxObjModel()
+    solver.solve(maxobj.model)
+    results.solution_loader.load_vars()
+    assert pyo.value(simple.model.obj) == 196
+
+
+def test_progress_timeline():
+    simple = SimpleModel()
+    results = solver.solve(simple.model, progress_timeline=True)
+    timeline = results.extra_info.progress_timeline
+    assert len(timeline['wall_time']) == len(timeline['incumbent'])
+    assert len(timeline['wall_time']) == len(timeline['bound'])
+    wall_times = list(timeline['wall_time'])
+    assert wall_times == sorted(wall_times)
+    assert timeline['incumbent'][-1] == 196
+    assert timeline['bound'][-1] == 196
+    results = solver.solve(simple.model)
+    assert 'progress_timeline' not in results.extra_info
+    assert solver._solver_solver.best_bound_callback is None
+
+
+def test_tee():
+    simple = SimpleModel()
+    stream = io.StringIO()
+    solver.solve(simple.model, tee=stream)
+    assert 'CP-SAT solver' in stream.getvalue()
+
+
+def test_concurrent_solves():
+    def solve_simple_model(k):
+        simple = SimpleModel()
+        results = solver.solve(simple.model, threads=1)
+        return results.incumbent_objective, pyo.value(simple.model.obj)
+
+    inactive = InactiveConModel()
+    solver.solve(inactive.model)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        values = list(executor.map(solve_simple_model, range(8)))
+    assert values == [(196, 196)] * 8
+    # The state of the last solve of this thread is unchanged
+    assert solver._model is inactive.model
+    assert len(solver._solver_model.proto.constraints) == 1
 
 
 def test_pyomo_equivalent_keys_threads():
@@ -102,6 +184,103 @@ def test_pyomo_equivalent_keys_abs_gap():
         )
 
 
+def test_pyomo_equivalent_keys_deterministic_time_limit():
+    with pytest.raises(KeyError):
+        simple = SimpleModel()
+        solver.solve(
+            simple.model,
+            deterministic_time_limit=10,
+            solver_options={
+                'max_deterministic_time': 10,
+            },
+        )
+
+
+def test_work_limit_options():
+    simple = SimpleModel()
+    results = solver.solve(
+        simple.model,
+        threads=2,
+        deterministic_time_limit=10,
+        interleave_search=True,
+        full_subsolvers=1,
+    )
+    assert pyo.value(simple.model.obj) == 196
+    parameters = solver._solver_solver.parameters
+    assert parameters.max_deterministic_time == 10
+    assert parameters.interleave_search
+    assert parameters.num_full_subsolvers == 1
+    assert 0 < results.extra_info.deterministic_time <= 10
+
+
+def test_full_subsolvers_threads():
+    with pytest.raises(ValueError):
+        simple = SimpleModel()
+        solver.solve(simple.model, threads=1, full_subsolvers=2)
+
+
+def test_auto_threads():
+    simple = SimpleModel()
+    results = solver.solve(simple.model, auto_threads=True)
+    assert results.extra_info.num_workers == 1
+    assert solver._solver_solver.parameters.num_workers == 1
+
+
+def test_auto_threads_threads():
+    with pytest.raises(ValueError):
+        simple = SimpleModel()
+        solver.solve(simple.model, auto_threads=True, threads=2)
+
+
+def test_scale_objective():
+    fractional = FractionalObjModel()
+    results = solver.solve(fractional.model, scale_objective=True)
+    assert results.extra_info.objective_scale == 60
+    assert results.incumbent_objective == 2.85
+    assert results.objective_bound == 2.85
+    proto = solver._solver_model.proto
+    assert _has_field(proto, 'objective')
+    assert not _has_field(proto, 'floating_point_objective')
+
+
+def test_scale_objective_precision():
+    fractional = FractionalObjModel()
+    results = solver.solve(
+        fractional.model,
+        scale_objective=True,
+        objective_precision=0.01,
+        raise_exception_on_nonoptimal_result=False,
+    )
+    assert results.extra_info.objective_scale == 100
+    assert results.incumbent_objective == pytest.approx(2.85)
+    assert results.incumbent_objective == pyo.value(fractional.model.obj)
+    # 1/3 is rounded to 0.33, so the solution is not proven optimal
+    assert results.solution_status == SolutionStatus.feasible
+    assert results.objective_bound >= results.incumbent_objective
+
+
+def test_scale_objective_precision_bound():
+    minobj = MinObjModel()
+    minobj.model.x[1].setlb(2)
+    minobj.model.obj.expr = 0.3366 * minobj.model.x[1]
+    results = solver.solve(
+        minobj.model,
+        scale_objective=True,
+        objective_precision=0.01,
+        raise_exception_on_nonoptimal_result=False,
+    )
+    assert results.incumbent_objective == pytest.approx(0.6732)
+    assert results.objective_bound <= results.incumbent_objective
+    assert results.solution_status == SolutionStatus.feasible
+
+
+def test_scale_objective_inexact():
+    with pytest.raises(IncompatibleModelError):
+        fractional = FractionalObjModel()
+        fractional.model.obj.expr += 3.14159265358979 * fractional.model.x[1]
+        solver.solve(fractional.model, scale_objective=True)
+
+
 def test_realvars():
     with pytest.raises(IncompatibleModelError):
         realvars = RealVarsModel()
@@ -204,6 +383,168 @@ def test_constantobj():
     assert pyo.value(constantobj.model.obj) == 500
 
 
+def test_named_expression_cache():
+    simple = SimpleModel()
+    solver.solve(simple.model)
+    assert id(simple.model.total_cakes) in solver._repn_visitor.subexpression_cache
+
+
+def test_fractional_coef():
+    with pytest.raises(IncompatibleModelError):
+        maxobj = MaxObjModel()
+        maxobj.model.fractional_con = pyo.Constraint(
+            expr=2.5 * maxobj.model.x[1] + maxobj.model.x[2] <= 10
+        )
+        solver.solve(maxobj.model)
+
+
+def test_integral_float_coef():
+    maxobj = MaxObjModel()
+    maxobj.model.float_con = pyo.Constraint(
+        expr=2.0 * maxobj.model.x[1] + maxobj.model.x[2] <= 1
+    )
+    solver.solve(maxobj.model)
+    assert pyo.value(maxobj.model.obj) == 1
+    assert list(solver._solver_model.proto.constraints[1].linear.coeffs) == [2, 1]
+
+
+def test_strict_integer():
+    simple = SimpleModel()
+    solver.solve(simple.model, strict_integer=True)
+    assert pyo.value(simple.model.obj) == 196
+
+
+def test_strict_integer_row_bounds():
+    simple = SimpleModel()
+    solver.solve(simple.model, strict_integer=True)
+    total_cakes_con = solver._solver_model.proto.constraints[2]
+    assert list(total_cakes_con.linear.domain) == [4, 300]
+
+
+def test_strict_integer_fractional():
+    with pytest.raises(IncompatibleModelError):
+        fractional = FractionalConModel()
+        solver.solve(fractional.model, strict_integer=True)
+
+
+def test_strict_integer_overflow():
+    with pytest.raises(IncompatibleModelError):
+        overflow = OverflowModel()
+        solver.solve(overflow.model, strict_integer=True)
+
+
+def test_strict_integer_exact():
+    large = LargeCoefModel()
+    solver.solve(large.model, strict_integer=True)
+    assert pyo.value(large.model.obj) == 1
+    con = solver._solver_model.proto.constraints[0]
+    assert list(con.linear.coeffs) == [2**53 + 1, 1]
+    assert list(con.linear.domain)[1] == 2**53 + 1
+    assert list(solver._solver_model.proto.variables[2].domain) == [0, 2**53 + 1]
+
+
+def test_strict_integer_var_bound_out_of_range():
+    with pytest.raises(IncompatibleModelError):
+        large = LargeCoefModel()
+        large.model.z.setub(2**62 + 1)
+        solver.solve(large.model, strict_integer=True)
+
+
+def test_strict_integer_infeasible():
+    infeasible = InfeasibleModel()
+    results = solver.solve(
+        infeasible.model,
+        strict_integer=True,
+        raise_exception_on_nonoptimal_result=False,
+        load_solutions=False,
+    )
+    assert results.termination_condition == TerminationCondition.provenInfeasible
+
+
+def test_reduce_rows():
+    reducible = ReducibleModel()
+    solver.solve(reducible.model, reduce_rows=True)
+    assert pyo.value(reducible.model.obj) == 16
+    assert len(solver._solver_model.proto.constraints) == 1
+    assert list(solver._solver_model.proto.constraints[0].linear.domain)[-1] == 6
+    assert list(solver._solver_model.proto.variables[0].domain) == [0, 3]
+
+
+def test_reduce_rows_infeasible():
+    maxobj = MaxObjModel()
+    maxobj.model.singleton_con_1 = pyo.Constraint(expr=maxobj.model.x[1] >= 6)
+    maxobj.model.singleton_con_2 = pyo.Constraint(expr=maxobj.model.x[1] <= 5)
+    results = solver.solve(
+        maxobj.model,
+        reduce_rows=True,
+        raise_exception_on_nonoptimal_result=False,
+        load_solutions=False,
+    )
+    assert results.termination_condition == TerminationCondition.provenInfeasible
+
+
+def test_domain_values():
+    batch = BatchSizeModel()
+    solver.solve(batch.model)
+    assert pyo.value(batch.model.obj) == 150
+    domain = list(solver._solver_model.proto.variables[0].domain)
+    assert domain == [0, 0, 50, 50, 100, 100, 200, 200]
+
+
+def test_domain_values_reduce_rows():
+    batch = BatchSizeModel()
+    batch.model.singleton_con = pyo.Constraint(expr=batch.model.x[1] <= 120)
+    solver.solve(batch.model, reduce_rows=True)
+    domain = list(solver._solver_model.proto.variables[0].domain)
+    assert domain == [0, 0, 50, 50, 100, 100]
+
+
+def test_domain_values_single():
+    batch = BatchSizeModel()
+    batch.model.y = pyo.Var(domain=pyo.Set(initialize=[3]))
+    solver.solve(batch.model)
+    assert pyo.value(batch.model.obj) == 150
+    assert pyo.value(batch.model.y) == 3
+
+
+def test_domain_values_fractional():
+    with pytest.raises(IncompatibleModelError):
+        batch = BatchSizeModel()
+        batch.model.y = pyo.Var(domain=pyo.Set(initialize=[0, 1.5]))
+        solver.solve(batch.model)
+
+
+def test_presolve_only():
+    simple = SimpleModel()
+    results = solver.solve(simple.model, presolve_only=True)
+    assert results.termination_condition == TerminationCondition.unknown
+    stats = results.extra_info.presolve_stats
+    assert stats['num_variables'] == 3
+    assert stats['num_constraints'] == 3
+    assert stats['presolved_num_variables'] <= stats['num_variables']
+    assert simple.model.x['chocolate'].value is None
+
+
+def test_presolve_only_tightened():
+    # The model is presolved completely by every supported version of CP-SAT
+    minobj = MinObjModel()
+    results = solver.solve(
+        minobj.model, presolve_only=True, presolve_tightened_model=True
+    )
+    stats = results.extra_info.presolve_stats
+    assert stats['presolved_num_variables'] == 0
+    assert stats['num_fixed_variables'] == stats['num_variables']
+    tightened_model = results.extra_info.presolve_tightened_model
+    domains = [list(var.domain) for var in tightened_model.variables]
+    assert all(domain[0] == domain[-1] for domain in domains)
+
+
+def test_presolve_only_decomposition():
+    with pytest.raises(ValueError):
+        simple = SimpleModel()
+        solver.solve(simple.model, presolve_only=True, decomposition='components')
+
+
 def test_inactive_obj():
     with pytest.raises(ValueError):
         simple = SimpleModel()
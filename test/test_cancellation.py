@@ -0,0 +1,101 @@
+import signal
+import time
+
+import pyomo.environ as pyo
+from concurrent.futures import ThreadPoolExecutor
+from pyomo.contrib.solver.common.results import SolutionStatus, TerminationCondition
+from pyomo_cpsat import Cpsat, CancellationToken, LargeNeighborhoodSearch
+from model import SimpleModel, MultiKnapsackModel
+
+solver = Cpsat()
+
+
+def wait_for_search(token, future):
+    """
+    Wait until the CP-SAT search of a solve has started and has had time to
+    find solutions.
+    """
+    while not token._solvers and not future.done():
+        time.sleep(0.01)
+    time.sleep(0.5)
+
+
+## Start tests
+def test_cancel():
+    knapsack = MultiKnapsackModel()
+    token = CancellationToken()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(
+            solver.solve,
+            knapsack.model,
+            time_limit=60,
+            cancellation_token=token,
+            raise_exception_on_nonoptimal_result=False,
+        )
+        wait_for_search(token, future)
+        token.cancel()
+        results = future.result()
+    assert results.termination_condition == TerminationCondition.interrupted
+    assert results.solution_status == SolutionStatus.feasible
+    assert results.timing_info.cpsat_time < 30
+    assert pyo.value(knapsack.model.obj) == results.incumbent_objective
+
+
+def test_cancel_before_solve():
+    simple = SimpleModel()
+    token = CancellationToken()
+    token.cancel()
+    results = solver.solve(
+        simple.model,
+        cancellation_token=token,
+        raise_exception_on_nonoptimal_result=False,
+        load_solutions=False,
+    )
+    assert results.termination_condition == TerminationCondition.interrupted
+    assert results.solution_status == SolutionStatus.noSolution
+
+
+def test_cancel_on_sigint():
+    knapsack = MultiKnapsackModel()
+    token = CancellationToken()
+    with token.cancel_on_sigint(), ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(
+            solver.solve,
+            knapsack.model,
+            time_limit=60,
+            cancellation_token=token,
+            raise_exception_on_nonoptimal_result=False,
+        )
+        wait_for_search(token, future)
+        # The signal is raised while the handler of the token is installed
+        signal.raise_signal(signal.SIGINT)
+        results = future.result()
+    assert token.cancelled
+    assert results.termination_condition == TerminationCondition.interrupted
+    assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+
+
+class CancelledLargeNeighborhoodSearch(LargeNeighborhoodSearch):
+    """
+    Cancels the token of the solve once the initial incumbent is found.
+    """
+
+    def _optimize_initial_values(self):
+        super()._optimize_initial_values()
+        self._config.cancellation_token.cancel()
+
+
+def test_cancel_lns():
+    knapsack = MultiKnapsackModel()
+    token = CancellationToken()
+    for i in knapsack.model.I:
+        knapsack.model.x[i].set_value(0)
+    results = CancelledLargeNeighborhoodSearch().solve(
+        knapsack.model,
+        use_initial_values=True,
+        neighborhoods=[[knapsack.model.x]],
+        lns_rounds=100,
+        cancellation_token=token,
+    )
+    assert results.termination_condition == TerminationCondition.interrupted
+    assert results.extra_info.lns_objective_values == [0]
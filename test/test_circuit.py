@@ -0,0 +1,51 @@
+import pytest
+import pyomo.environ as pyo
+from pyomo_cpsat import Cpsat, IncompatibleModelError
+from pyomo_cpsat.cpsat import _constraint_kind, _has_field
+from model import TravelingSalesmanModel
+
+solver = Cpsat()
+
+
+## Start tests
+def test_circuit():
+    tsp = TravelingSalesmanModel()
+    solver.solve(tsp.model, circuits=[(tsp.model.x, None, [tsp.model.mtz_con])])
+    assert pyo.value(tsp.model.obj) == 24
+    kinds = [_constraint_kind(con) for con in solver._solver_model.proto.constraints]
+    assert kinds.count('circuit') == 1
+    assert kinds.count('linear') == len(tsp.model.out_con) + len(tsp.model.in_con)
+
+
+def test_multiple_circuit():
+    tsp = TravelingSalesmanModel()
+    replaced = [tsp.model.mtz_con, tsp.model.out_con, tsp.model.in_con]
+    solver.solve(tsp.model, circuits=[(tsp.model.x, 1, replaced)])
+    assert pyo.value(tsp.model.obj) == 24
+    assert len(solver._solver_model.proto.constraints) == 1
+    assert _has_field(solver._solver_model.proto.constraints[0], 'routes')
+    for j in tsp.model.N - [1]:
+        assert sum(tsp.model.x[i, j].value for i in tsp.model.N if i != j) == 1
+
+
+def test_circuit_decomposition():
+    tsp = TravelingSalesmanModel()
+    tsp.model.y = pyo.Var(domain=pyo.Integers, bounds=(0, 3))
+    tsp.model.y_con = pyo.Constraint(expr=tsp.model.y >= 2)
+    results = solver.solve(
+        tsp.model,
+        circuits=[(tsp.model.x, None, [tsp.model.mtz_con])],
+        decomposition='components',
+        decomposition_workers=2,
+    )
+    assert results.extra_info.decomposition_groups == 2
+    assert pyo.value(tsp.model.obj) == 24
+    assert tsp.model.y.value == 2
+
+
+def test_circuit_not_binary():
+    with pytest.raises(IncompatibleModelError):
+        tsp = TravelingSalesmanModel()
+        tsp.model.x[1, 2].domain = pyo.Integers
+        tsp.model.x[1, 2].setub(2)
+        solver.solve(tsp.model, circuits=[(tsp.model.x, None)])
@@ -0,0 +1,70 @@
+import pytest
+import pyomo.environ as pyo
+from pyomo.contrib.solver.common.results import SolutionStatus
+from pyomo_cpsat import Cpsat
+from model import SimpleModel, MinObjModel, InfeasibleModel, MultiSiteModel
+
+solver = Cpsat()
+
+
+## Start tests
+def test_decomposition_components():
+    multisite = MultiSiteModel()
+    results = solver.solve(
+        multisite.model, decomposition='components', decomposition_workers=4
+    )
+    assert results.solution_status == SolutionStatus.optimal
+    assert results.extra_info.decomposition_groups == 2
+    assert results.incumbent_objective == 92
+    assert pyo.value(multisite.model.obj) == 92
+
+
+def test_decomposition_blocks():
+    multisite = MultiSiteModel()
+    results = solver.solve(
+        multisite.model, decomposition='blocks', decomposition_workers=1
+    )
+    assert results.extra_info.decomposition_groups == 1
+    assert pyo.value(multisite.model.obj) == 92
+
+
+def test_decomposition_objective_offset():
+    simple = SimpleModel()
+    results = solver.solve(simple.model, decomposition='components')
+    assert results.incumbent_objective == 196
+    assert pyo.value(simple.model.obj) == 196
+
+
+def test_decomposition_no_vars():
+    m = pyo.ConcreteModel()
+    m.obj = pyo.Objective(expr=5)
+    results = solver.solve(m, decomposition='components')
+    assert results.extra_info.decomposition_groups == 1
+    assert results.incumbent_objective == 5
+
+
+def test_decomposition_minimize():
+    minobj = MinObjModel()
+    results = solver.solve(minobj.model, decomposition='components')
+    assert results.incumbent_objective == 0
+
+
+def test_decomposition_infeasible():
+    infeasible = InfeasibleModel()
+    results = solver.solve(
+        infeasible.model,
+        decomposition='components',
+        raise_exception_on_nonoptimal_result=False,
+        load_solutions=False,
+    )
+    assert results.solution_status == SolutionStatus.infeasible
+
+
+def test_decomposition_lexicographic():
+    with pytest.raises(ValueError):
+        simple = SimpleModel()
+        solver.solve(
+            simple.model,
+            decomposition='components',
+            lexicographic_objectives=[simple.model.obj],
+        )
@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+
+## Start tests
+def test_import_does_not_load_ortools():
+    out = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import sys; import pyomo_cpsat; print("ortools" in sys.modules)',
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == 'False'
+
+
+def test_solver_factory_registration():
+    out = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import sys; import pyomo_cpsat; '
+            'from pyomo.contrib.solver.common.factory import SolverFactory; '
+            'solver = SolverFactory("cpsat"); '
+            'print("ortools" in sys.modules, bool(solver.available()))',
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == 'False True'
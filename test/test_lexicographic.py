@@ -0,0 +1,59 @@
+import pytest
+import pyomo.environ as pyo
+from pyomo.contrib.solver.common.results import SolutionStatus
+from pyomo_cpsat import Cpsat
+from model import LexicographicModel
+
+solver = Cpsat()
+
+
+## Start tests
+def test_lexicographic():
+    lex = LexicographicModel()
+    results = solver.solve(
+        lex.model, lexicographic_objectives=[lex.model.obj1, lex.model.obj2]
+    )
+    assert results.solution_status == SolutionStatus.optimal
+    assert results.extra_info.lexicographic_objective_values == [10, 0]
+    assert (
+        lex.model.x[1].value == 0
+        and lex.model.x[2].value == 10
+        and lex.model.x[3].value == 0
+    )
+
+
+def test_lexicographic_tolerance():
+    lex = LexicographicModel()
+    results = solver.solve(
+        lex.model,
+        lexicographic_objectives=[lex.model.obj1, lex.model.obj2],
+        lexicographic_tolerance=2,
+    )
+    assert results.extra_info.lexicographic_objective_values == [10, 4]
+    assert pyo.value(lex.model.obj1) == 8
+
+
+def test_lexicographic_scale_objective():
+    lex = LexicographicModel()
+    lex.model.obj1.expr = 0.5 * lex.model.x[1] + lex.model.x[2]
+    results = solver.solve(
+        lex.model,
+        lexicographic_objectives=[lex.model.obj1, lex.model.obj2],
+        lexicographic_tolerance=1,
+        scale_objective=True,
+    )
+    assert results.extra_info.lexicographic_objective_values == [10, 2]
+    assert pyo.value(lex.model.obj1) == 9
+
+
+def test_lexicographic_reuses_model():
+    lex = LexicographicModel()
+    solver.solve(lex.model, lexicographic_objectives=[lex.model.obj1, lex.model.obj2])
+    assert len(solver._solver_model.proto.constraints) == 2
+    assert len(solver._solver_model.proto.solution_hint.vars) == 3
+
+
+def test_lexicographic_empty():
+    with pytest.raises(ValueError):
+        lex = LexicographicModel()
+        solver.solve(lex.model, lexicographic_objectives=[])
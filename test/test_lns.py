@@ -0,0 +1,77 @@
+import pytest
+import pyomo.environ as pyo
+from pyomo.contrib.solver.common.results import SolutionStatus
+from pyomo_cpsat import LargeNeighborhoodSearch
+from model import SimpleModel, MaxObjModel
+
+solver = LargeNeighborhoodSearch()
+
+
+## Start tests
+def test_lns():
+    maxobj = MaxObjModel()
+    for i in maxobj.model.I:
+        maxobj.model.x[i].set_value(0)
+    results = solver.solve(
+        maxobj.model,
+        neighborhoods=[[maxobj.model.x[i]] for i in maxobj.model.I],
+        use_initial_values=True,
+    )
+    assert results.solution_status == SolutionStatus.feasible
+    assert results.extra_info.lns_objective_values == [0, 2, 2, 2]
+    assert pyo.value(maxobj.model.obj) == 2
+
+
+def test_lns_parallel():
+    maxobj = MaxObjModel()
+    for i in maxobj.model.I:
+        maxobj.model.x[i].set_value(0)
+    results = solver.solve(
+        maxobj.model,
+        neighborhoods=[[maxobj.model.x[i]] for i in maxobj.model.I],
+        use_initial_values=True,
+        lns_workers=3,
+        lns_rounds=2,
+    )
+    assert results.extra_info.lns_objective_values == [0, 2, 2]
+    assert pyo.value(maxobj.model.obj) == 2
+
+
+def test_lns_indexed_neighborhood():
+    simple = SimpleModel()
+    for k in simple.model.K:
+        simple.model.x[k].set_value(0)
+    solver.solve(
+        simple.model,
+        neighborhoods=[[simple.model.x]],
+        use_initial_values=True,
+        raise_exception_on_nonoptimal_result=False,
+    )
+    assert pyo.value(simple.model.obj) == 196
+
+
+def test_lns_infeasible_initial_values():
+    maxobj = MaxObjModel()
+    for i in maxobj.model.I:
+        maxobj.model.x[i].set_value(100)
+    results = solver.solve(
+        maxobj.model,
+        neighborhoods=[[maxobj.model.x[i]] for i in maxobj.model.I],
+        use_initial_values=True,
+    )
+    assert results.solution_status == SolutionStatus.optimal
+    assert results.extra_info.lns_objective_values == [2]
+    assert pyo.value(maxobj.model.obj) == 2
+
+
+def test_lns_initial_optimal():
+    simple = SimpleModel()
+    results = solver.solve(simple.model, neighborhoods=[[simple.model.x]])
+    assert results.solution_status == SolutionStatus.optimal
+    assert results.extra_info.lns_objective_values == [196]
+
+
+def test_lns_no_neighborhoods():
+    with pytest.raises(ValueError):
+        simple = SimpleModel()
+        solver.solve(simple.model)
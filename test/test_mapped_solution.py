@@ -0,0 +1,69 @@
+import multiprocessing
+
+import pytest
+import pyomo.environ as pyo
+from concurrent.futures import ProcessPoolExecutor
+from pyomo.contrib.solver.common.util import NoFeasibleSolutionError
+from pyomo_cpsat import Cpsat, MappedSolution
+from model import SimpleModel, InfeasibleModel
+
+solver = Cpsat()
+
+
+def solve_simple_model(path):
+    simple = SimpleModel()
+    Cpsat().solve(simple.model, solution_file=path, load_solutions=False)
+
+
+## Start tests
+def test_mapped_solution(tmp_path):
+    path = str(tmp_path / 'solution.bin')
+    simple = SimpleModel()
+    solver.solve(simple.model, solution_file=path)
+    expected = [simple.model.x[k].value for k in simple.model.K]
+
+    simple = SimpleModel()
+    mapped = MappedSolution(path)
+    assert mapped.status == 4
+    assert mapped.objective_value == 196
+    mapped.load_vars(simple.model)
+    assert [simple.model.x[k].value for k in simple.model.K] == expected
+    assert pyo.value(simple.model.obj) == 196
+
+
+def test_mapped_solution_vars_to_load(tmp_path):
+    path = str(tmp_path / 'solution.bin')
+    simple = SimpleModel()
+    solver.solve(simple.model, solution_file=path)
+    expected = simple.model.x['matcha'].value
+
+    simple = SimpleModel()
+    MappedSolution(path).load_vars(
+        simple.model, vars_to_load=[simple.model.x['matcha']]
+    )
+    assert simple.model.x['matcha'].value == expected
+    assert simple.model.x['chocolate'].value is None
+
+
+def test_mapped_solution_process(tmp_path):
+    path = str(tmp_path / 'solution.bin')
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        executor.submit(solve_simple_model, path).result()
+
+    simple = SimpleModel()
+    MappedSolution(path).load_vars(simple.model)
+    assert pyo.value(simple.model.obj) == 196
+
+
+def test_mapped_solution_infeasible(tmp_path):
+    path = str(tmp_path / 'solution.bin')
+    infeasible = InfeasibleModel()
+    solver.solve(
+        infeasible.model,
+        solution_file=path,
+        raise_exception_on_nonoptimal_result=False,
+        load_solutions=False,
+    )
+    with pytest.raises(NoFeasibleSolutionError):
+        MappedSolution(path).load_vars(infeasible.model)
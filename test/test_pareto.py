@@ -0,0 +1,55 @@
+import math
+
+import pytest
+import pyomo.environ as pyo
+from pyomo.contrib.solver.common.results import SolutionStatus
+from pyomo_cpsat import ParetoFront
+from model import ParetoModel
+
+solver = ParetoFront()
+
+
+## Start tests
+def test_pareto():
+    pareto = ParetoModel()
+    m = pareto.model
+    results = solver.solve(m, secondary_objective=m.cost_obj, pareto_solutions=True)
+    assert results.solution_status == SolutionStatus.feasible
+    front = results.extra_info.pareto_front
+    assert list(front['epsilon']) == [19, 14, 10, 6, 2]
+    assert list(front['objective']) == [25, 18, 12, 8, 0]
+    assert list(front['secondary_objective']) == [19, 14, 10, 6, 2]
+    assert front['solutions'].shape == (5, 4)
+    # The point with the loosest level is loaded
+    assert pyo.value(m.value_obj) == 25
+
+
+def test_pareto_parallel():
+    pareto = ParetoModel()
+    m = pareto.model
+    results = solver.solve(
+        m,
+        secondary_objective=m.cost_obj,
+        epsilon_levels=[3, 6, 9, 12, 19],
+        pareto_workers=3,
+    )
+    front = results.extra_info.pareto_front
+    assert list(front['epsilon']) == [19, 12, 9, 6, 3]
+    assert list(front['objective']) == [25, 15, 10, 8, 3]
+    assert 'solutions' not in front
+    assert len(solver._solver_model.proto.solution_hint.vars) == 0
+
+
+def test_pareto_infeasible_level():
+    pareto = ParetoModel()
+    m = pareto.model
+    results = solver.solve(m, secondary_objective=m.cost_obj, epsilon_levels=[10, 1])
+    front = results.extra_info.pareto_front
+    assert front['objective'][0] == 12
+    assert math.isnan(front['objective'][1])
+
+
+def test_pareto_no_secondary():
+    with pytest.raises(ValueError):
+        pareto = ParetoModel()
+        solver.solve(pareto.model)
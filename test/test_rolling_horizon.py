@@ -0,0 +1,65 @@
+import pytest
+import pyomo.environ as pyo
+from pyomo.contrib.solver.common.results import SolutionStatus
+from pyomo_cpsat import Cpsat, RollingHorizon
+from model import LotSizingModel
+
+solver = RollingHorizon()
+
+
+def is_feasible(model):
+    return all(
+        (c.lb is None or pyo.value(c.body) >= c.lb)
+        and (c.ub is None or pyo.value(c.body) <= c.ub)
+        for c in model.component_data_objects(pyo.Constraint, active=True)
+    )
+
+
+## Start tests
+def test_rolling_horizon():
+    lotsizing = LotSizingModel()
+    results = solver.solve(lotsizing.model, time_set=lotsizing.model.T, window_size=2)
+    assert results.solution_status == SolutionStatus.feasible
+    assert len(results.extra_info.window_objective_values) == 2
+    assert is_feasible(lotsizing.model)
+    assert results.incumbent_objective == pyo.value(lotsizing.model.obj)
+
+
+def test_rolling_horizon_overlapping_windows():
+    lotsizing = LotSizingModel()
+    results = solver.solve(
+        lotsizing.model, time_set=lotsizing.model.T, window_size=2, window_step=1
+    )
+    assert len(results.extra_info.window_objective_values) == 3
+    assert is_feasible(lotsizing.model)
+
+
+def test_rolling_horizon_bound():
+    lotsizing = LotSizingModel()
+    Cpsat().solve(lotsizing.model)
+    optimal_value = pyo.value(lotsizing.model.obj)
+    results = solver.solve(lotsizing.model, time_set=lotsizing.model.T, window_size=1)
+    assert results.incumbent_objective >= optimal_value
+
+
+def test_rolling_horizon_single_window():
+    lotsizing = LotSizingModel()
+    results = solver.solve(lotsizing.model, time_set=lotsizing.model.T, window_size=4)
+    assert results.solution_status == SolutionStatus.optimal
+
+
+def test_rolling_horizon_time_indexed_vars():
+    lotsizing = LotSizingModel()
+    solver.solve(
+        lotsizing.model,
+        time_set=lotsizing.model.T,
+        time_indexed_vars=[lotsizing.model.x, lotsizing.model.y],
+        window_size=2,
+    )
+    assert is_feasible(lotsizing.model)
+
+
+def test_rolling_horizon_no_time_set():
+    with pytest.raises(ValueError):
+        lotsizing = LotSizingModel()
+        solver.solve(lotsizing.model)
@@ -0,0 +1,114 @@
+import pytest
+import numpy as np
+from pyomo.contrib.solver.common.results import TerminationCondition
+from pyomo_cpsat import IncompatibleModelError, StreamingModel, StreamingCpsat
+
+solver = StreamingCpsat()
+
+cake_types = ['chocolate', 'vanilla', 'matcha']
+
+
+def simple_streaming_model():
+    """
+    The SimpleModel of model.py, built as a StreamingModel.
+    """
+    stream = StreamingModel()
+    stream.add_vars('x', cake_types, 0, 100)
+
+    # Ingredients available: eggs, flour
+    stream.add_csr_rows(
+        indptr=[0, 3, 6],
+        indices=[0, 1, 2, 0, 1, 2],
+        data=np.array([4.0, 2.0, 3.0, 4.0, 6.0, 5.0]),
+        ub=[32, 48],
+    )
+
+    # Total cakes
+    stream.add_rows(([0, 1, 2], [1, 1, 1], 4, None) for _ in range(1))
+
+    stream.maximize([0, 1, 2], [3, 4, 5], offset=150)
+
+    return stream
+
+
+## Start tests
+def test_streaming():
+    stream = simple_streaming_model()
+    results = solver.solve(stream)
+    assert results.termination_condition == (
+        TerminationCondition.convergenceCriteriaSatisfied
+    )
+    assert results.incumbent_objective == 196
+    values = stream.values('x')
+    assert sum(p * values[k] for p, k in zip([3, 4, 5], cake_types)) == 46
+    assert stream.value('x', 'matcha') == values['matcha']
+
+
+def test_streaming_index_tuples():
+    stream = StreamingModel()
+    start = stream.add_vars('y', [(i, j) for i in range(2) for j in range(3)], 0, 5)
+    stream.add_vars('z', None, 0, 10)
+    assert stream.position('y', (1, 0)) == start + 3
+    assert stream.position('z') == 6
+    stream.add_rows(
+        ([stream.position('y', (i, j)) for j in range(3)], [1, 1, 1], None, 4)
+        for i in range(2)
+    )
+    stream.add_rows([([0, 6], [1, -1], 0, 0)])
+    stream.maximize(list(range(7)), [1] * 7)
+    solver.solve(stream)
+    assert sum(stream.values('y').values()) == 8
+    assert stream.value('z') == stream.value('y', (0, 0))
+
+
+def test_streaming_decomposition():
+    stream = simple_streaming_model()
+    stream.add_vars('w', range(2), 0, 3)
+    stream.add_rows([([3, 4], [1, 1], None, 5)])
+    stream.maximize([0, 1, 2, 3, 4], [3, 4, 5, 1, 1], offset=150)
+    results = solver.solve(stream, decomposition='components', decomposition_workers=2)
+    assert results.extra_info.decomposition_groups == 2
+    assert results.incumbent_objective == 201
+
+
+def test_streaming_fractional():
+    with pytest.raises(IncompatibleModelError):
+        stream = StreamingModel()
+        stream.add_vars('x', range(2), 0, 10)
+        stream.add_csr_rows([0, 2], [0, 1], [1.5, 1.0], ub=5)
+
+
+def test_streaming_unknown_var():
+    with pytest.raises(ValueError):
+        stream = StreamingModel()
+        stream.add_vars('x', range(2), 0, 10)
+        stream.add_csr_rows([0, 2], [0, 2], [1, 1], ub=5)
+
+
+def test_streaming_infinite_coef():
+    with pytest.raises(IncompatibleModelError):
+        stream = StreamingModel()
+        stream.add_vars('x', range(2), 0, 10)
+        stream.add_csr_rows([0, 2], [0, 1], [float('inf'), 1.0], ub=5)
+
+
+def test_streaming_rows_unknown_var():
+    with pytest.raises(ValueError):
+        stream = StreamingModel()
+        stream.add_vars('x', range(2), 0, 10)
+        stream.add_rows([([0, 2], [1, 1], None, 5)])
+
+
+def test_streaming_scale_objective():
+    with pytest.raises(ValueError):
+        stream = StreamingModel()
+        stream.add_vars('x', range(2), 0, 10)
+        stream.maximize([0, 1], [1, 1])
+        solver.solve(stream, scale_objective=True)
+
+
+def test_streaming_no_objective():
+    with pytest.raises(ValueError):
+        stream = StreamingModel()
+        stream.add_vars('x', range(2), 0, 10)
+        solver.solve(stream)
@@ -0,0 +1,85 @@
+import pytest
+import pyomo.environ as pyo
+from pyomo_cpsat import Cpsat
+from model import BinPackingModel
+
+solver = Cpsat()
+
+
+def bin_vectors(model):
+    return [
+        [pyo.value(model.y[k])] + [pyo.value(model.x[j, k]) for j in model.J]
+        for k in model.K
+    ]
+
+
+## Start tests
+def test_symmetry_breaking():
+    binpacking = BinPackingModel()
+    m = binpacking.model
+    solver.solve(m, symmetric_index_sets=[(m.K, [m.y, (m.x, 1)])])
+    assert pyo.value(m.obj) == 2
+    vectors = bin_vectors(m)
+    assert vectors == sorted(vectors, reverse=True)
+    # The unused bins are the last ones
+    assert [pyo.value(m.y[k]) for k in m.K] == [1, 1, 0, 0]
+
+
+def test_symmetry_breaking_decomposition():
+    binpacking = BinPackingModel()
+    m = binpacking.model
+    solver.solve(
+        m,
+        symmetric_index_sets=[(m.K, [m.y, (m.x, 1)])],
+        decomposition='components',
+        decomposition_workers=2,
+    )
+    assert pyo.value(m.obj) == 2
+    vectors = bin_vectors(m)
+    assert vectors == sorted(vectors, reverse=True)
+
+
+def test_symmetry_breaking_decomposition_components():
+    # The negated literals of the symmetry breaking constraints do not join the
+    # variable declared first to the bin packing component
+    m = pyo.ConcreteModel()
+    m.z = pyo.Var(domain=pyo.Integers, bounds=(0, 5))
+    m.z_con = pyo.Constraint(expr=m.z >= 2)
+    m.binpacking = BinPackingModel().model
+    b = m.binpacking
+    results = solver.solve(
+        m,
+        symmetric_index_sets=[(b.K, [b.y, (b.x, 1)])],
+        decomposition='components',
+        decomposition_workers=2,
+    )
+    assert results.extra_info.decomposition_groups == 2
+    assert pyo.value(b.obj) == 2
+    assert pyo.value(m.z) == 2
+
+
+def test_symmetry_breaking_constraints():
+    binpacking = BinPackingModel()
+    m = binpacking.model
+    solver.solve(m)
+    num_constraints = len(solver._solver_model.proto.constraints)
+    solver.solve(m, symmetric_index_sets=[(m.K, [m.y, (m.x, 1)])])
+    # Each of the 3 pairs of consecutive bins has vectors of 7 variables,
+    # ordered with 7 + 6 constraints and 5 implications
+    assert len(solver._solver_model.proto.constraints) == num_constraints + 3 * 18
+
+
+def test_symmetry_breaking_mismatch():
+    with pytest.raises(ValueError):
+        binpacking = BinPackingModel()
+        m = binpacking.model
+        m.z = pyo.Var([1, 2, 3], domain=pyo.Binary)
+        solver.solve(m, symmetric_index_sets=[(m.K, [m.z])])
+
+
+def test_symmetry_breaking_position():
+    with pytest.raises(ValueError):
+        binpacking = BinPackingModel()
+        m = binpacking.model
+        # The bins are at position 1 of the index of x
+        solver.solve(m, symmetric_index_sets=[(m.K, [(m.x, 0)])])